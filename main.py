@@ -4,29 +4,210 @@ Job Alert Notifier - Main entry point
 from src.config.config import load_config
 from src.utils.logger import setup_logger
 from src.utils.filters import JobFilter, ROMANIA_FILTER_CRITERIA, INTERNATIONAL_FILTER_CRITERIA, FilterCriteria
-from src.scrapers.remoteco import RemoteCoScraper
-from src.scrapers.linkedin import LinkedInScraper
-from src.scrapers.weworkremotely import WeWorkRemotelyScraper
-from src.scrapers.ejobs_ro import EJobsRoScraper
-from src.scrapers.hipo_ro import HipoRoScraper
-from src.scrapers.bestjobs_ro import BestJobsRoScraper
-from src.scrapers.base import BaseScraper
+from src.utils.dedup import RepostFilter
+from src.utils.bloom import BloomFilter
+from src.scrapers import get_all_scrapers
+from src.scrapers.base import BaseScraper, JobPosting
 from src.notifications.email_notifier import EmailNotifier
 from src.notifications.telegram_notifier import TelegramNotifier
-from typing import List, Type
+from typing import AsyncIterator, Awaitable, Callable, List, Optional, Set, Tuple
+import logging
 import os
 import asyncio
 
-# Define all available scrapers
-SCRAPERS: List[Type[BaseScraper]] = [
-    WeWorkRemotelyScraper,
-    #RemoteCoScraper,
-    #LinkedInScraper,
-    #HipoRoScraper,
-    #EJobsRoScraper,
-    #BestJobsRoScraper
+# Names of the scrapers to run; their modules are only imported when listed here
+SCRAPER_NAMES: List[str] = [
+    "WeWorkRemotelyScraper",
+    #"RemoteCoScraper",
+    #"LinkedInScraper",
+    #"HipoRoScraper",
+    #"EJobsRoScraper",
+    #"BestJobsRoScraper"
 ]
 
+# Maximum number of scrapers running at once. Each one holds a thread of the
+# default executor plus its own pool of fetch workers.
+MAX_CONCURRENT_SCRAPERS = 3
+
+# Maximum number of scraped jobs waiting to be filtered
+JOB_QUEUE_SIZE = 1000
+
+# Number of matching jobs sent per notification
+NOTIFICATION_BATCH_SIZE = 50
+
+def get_scrapers() -> Tuple[BaseScraper, ...]:
+    """
+    Get the instances of the scrapers in SCRAPER_NAMES, creating them on first use
+    
+    Instances come from the cached src.scrapers registry, so they (and their
+    HTTP connection pools) are reused across runs.
+    
+    Returns:
+        Tuple of scraper instances
+    """
+    return get_all_scrapers(tuple(SCRAPER_NAMES))
+
+async def close_scrapers() -> None:
+    """Release resources held by the cached scraper instances"""
+    if get_all_scrapers.cache_info().currsize:
+        await asyncio.gather(
+            *(scraper.aclose() for scraper in get_scrapers()),
+            return_exceptions=True
+        )
+        get_all_scrapers.cache_clear()
+
+async def run_scraper(scraper: BaseScraper,
+                      keywords: List[str],
+                      semaphore: asyncio.Semaphore,
+                      logger: logging.Logger) -> AsyncIterator[JobPosting]:
+    """
+    Run a single blocking scraper in worker threads, yielding jobs as they are scraped
+    
+    Args:
+        scraper: Scraper instance to run
+        keywords: List of keywords to search for
+        semaphore: Semaphore bounding the number of scrapers running at once
+        logger: Application logger
+        
+    Yields:
+        JobPosting objects; iteration stops early if the scraper fails
+    """
+    scraper_name = scraper.__class__.__name__
+    async with semaphore:
+        jobs = scraper.iter_jobs(keywords)
+        count = 0
+        try:
+            # Advance the blocking generator off the event loop, one job at a time
+            while (job := await asyncio.to_thread(next, jobs, None)) is not None:
+                count += 1
+                yield job
+            logger.info(f"Found {count} jobs from {scraper_name}")
+        except Exception as scraper_error:
+            logger.error(f"Error with {scraper_name}: {str(scraper_error)}")
+
+async def produce_jobs(scraper: BaseScraper,
+                       keywords: List[str],
+                       queue: "asyncio.Queue[Optional[JobPosting]]",
+                       semaphore: asyncio.Semaphore,
+                       logger: logging.Logger) -> None:
+    """
+    Run a scraper and push its jobs onto the queue as they arrive
+    
+    A None sentinel is always pushed last so the consumer knows the
+    scraper has finished, even if it failed.
+    
+    Args:
+        scraper: Scraper instance to run
+        keywords: List of keywords to search for
+        queue: Queue feeding the job consumer
+        semaphore: Semaphore bounding the number of scrapers running at once
+        logger: Application logger
+    """
+    try:
+        async for job in run_scraper(scraper, keywords, semaphore, logger):
+            await queue.put(job)
+    finally:
+        await queue.put(None)
+
+async def consume_jobs(queue: "asyncio.Queue[Optional[JobPosting]]",
+                       producer_count: int,
+                       job_filter: JobFilter,
+                       seen_jobs: BloomFilter,
+                       flush: Callable[[List[JobPosting]], Awaitable[None]],
+                       logger: logging.Logger) -> None:
+    """
+    Deduplicate and filter queued jobs, flushing matches in batches
+    
+    Duplicates are removed by URL before filtering, keeping the first posting
+    seen for each URL. Jobs already notified about in previous runs are
+    skipped, and reposts of the same job under another URL are dropped
+    after filtering.
+    
+    Args:
+        queue: Queue fed by the scraper producers
+        producer_count: Number of producers (sentinels to wait for)
+        job_filter: Filter applied to each job
+        seen_jobs: Bloom filter of job URLs notified about in previous runs
+        flush: Coroutine called with each batch of matching jobs
+        logger: Application logger
+    """
+    seen_urls: Set[int] = set()
+    reposts = RepostFilter()
+    batch: List[JobPosting] = []
+    finished = total = duplicates = previously_seen = repost_count = matches = 0
+    
+    while finished < producer_count:
+        job = await queue.get()
+        if job is None:
+            finished += 1
+            continue
+            
+        total += 1
+        if job.url:
+            if job.url_hash in seen_urls:
+                duplicates += 1
+                continue
+            seen_urls.add(job.url_hash)
+            if job.url in seen_jobs:
+                previously_seen += 1
+                continue
+                
+        if not job_filter.matches(job):
+            continue
+            
+        # Drop reposts of the same job under different URLs
+        if not reposts.add(job):
+            repost_count += 1
+            continue
+            
+        matches += 1
+        batch.append(job)
+        if len(batch) >= NOTIFICATION_BATCH_SIZE:
+            await flush(batch)
+            batch = []
+            
+    if batch:
+        await flush(batch)
+        
+    logger.info(f"Found {total} total jobs across all sources")
+    logger.info(
+        f"Removed {duplicates} duplicate jobs, {previously_seen} jobs seen in previous runs "
+        f"and {repost_count} reposted jobs"
+    )
+    logger.info(f"Found {matches} matching jobs")
+
+async def notify_all(jobs: List[JobPosting],
+                     email_notifier: EmailNotifier,
+                     telegram_notifier: TelegramNotifier,
+                     logger: logging.Logger) -> bool:
+    """
+    Send email and Telegram notifications concurrently
+    
+    Args:
+        jobs: List of jobs to notify about
+        email_notifier: Email notifier instance
+        telegram_notifier: Telegram notifier instance
+        logger: Application logger
+        
+    Returns:
+        bool: True if the email notification was sent successfully
+    """
+    email_result, telegram_result = await asyncio.gather(
+        asyncio.to_thread(email_notifier.send_notification, jobs),
+        telegram_notifier.send_notification(jobs),
+        return_exceptions=True
+    )
+    
+    # Log each channel's failure separately so one doesn't mask the other
+    if isinstance(email_result, BaseException):
+        logger.error(f"Email notification failed: {str(email_result)}")
+    if isinstance(telegram_result, BaseException):
+        logger.error(f"Telegram notification failed: {str(telegram_result)}")
+    elif telegram_result is not True:
+        logger.error("Telegram notification was not fully delivered")
+        
+    return email_result is True
+
 async def main() -> None:
     """Main application entry point"""
     # Load configuration
@@ -37,6 +218,10 @@ async def main() -> None:
     logger.info("Starting Job Alert Notifier")
     
     try:
+        # Load job URLs already notified about in previous runs
+        seen_jobs = BloomFilter.load_or_create(config.seen_jobs_file)
+        logger.info(f"Loaded {len(seen_jobs)} previously seen jobs")
+        
         # Choose which filter criteria to use
         FILTER_CRITERIA = FilterCriteria(
             keywords=INTERNATIONAL_FILTER_CRITERIA.keywords,
@@ -52,50 +237,52 @@ async def main() -> None:
         job_filter = JobFilter(FILTER_CRITERIA)
         
         # Initialize notifiers
-        email_notifier = EmailNotifier(
-            smtp_server=config.email.smtp_server,
-            smtp_port=config.email.smtp_port,
-            sender_email=config.email.sender_email,
-            sender_password=config.email.sender_password,
-            recipient_email=config.email.recipient_email
-        )
+        email_notifier = EmailNotifier(config=config.email)
         
         telegram_notifier = await TelegramNotifier.create(
             bot_token=os.getenv("TELEGRAM_BOT_TOKEN"),
             chat_id=os.getenv("TELEGRAM_CHAT_ID")
         )
         
-        # Aggregate jobs from all scrapers
-        all_jobs = []
-        for scraper_class in SCRAPERS:
-            try:
-                scraper = scraper_class()
-                jobs = scraper.scrape_jobs(FILTER_CRITERIA.keywords)
-                logger.info(f"Found {len(jobs)} jobs from {scraper_class.__name__}")
-                all_jobs.extend(jobs)
-            except Exception as scraper_error:
-                logger.error(f"Error with {scraper_class.__name__}: {str(scraper_error)}")
-                continue
-        
-        logger.info(f"Found {len(all_jobs)} total jobs across all sources")
+        async def flush(jobs: List[JobPosting]) -> None:
+            """Notify about a batch of jobs and remember them on success"""
+            if await notify_all(jobs, email_notifier, telegram_notifier, logger):
+                # Remember notified jobs so later runs skip them
+                for job in jobs:
+                    if job.url:
+                        seen_jobs.add(job.url)
+                seen_jobs.save(config.seen_jobs_file)
         
-        # Filter jobs
-        filtered_jobs = job_filter.filter_jobs(all_jobs)
-        logger.info(f"Found {len(filtered_jobs)} matching jobs for Romania")
-        
-        # Send notifications if there are matching jobs
-        if filtered_jobs:
-            # Remove duplicates based on job URL
-            unique_jobs = list({job.url: job for job in filtered_jobs}.values())
-            logger.info(f"Removed {len(filtered_jobs) - len(unique_jobs)} duplicate jobs")
-            
-            # Send notifications with deduplicated jobs
-            email_notifier.send_notification(unique_jobs)
-            await telegram_notifier.send_notification(unique_jobs)
+        # Stream jobs from all scrapers through a bounded queue. Up to
+        # MAX_CONCURRENT_SCRAPERS scrapers run concurrently since each one is
+        # dominated by network I/O against a different site, and matches are
+        # notified in batches as they arrive.
+        scrapers = await asyncio.to_thread(get_scrapers)
+        for scraper in scrapers:
+            # Let scrapers skip detail pages of jobs notified about before
+            scraper.known_urls = seen_jobs
+        queue: "asyncio.Queue[Optional[JobPosting]]" = asyncio.Queue(maxsize=JOB_QUEUE_SIZE)
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_SCRAPERS)
+        producers = [
+            asyncio.create_task(
+                produce_jobs(scraper, FILTER_CRITERIA.keywords, queue, semaphore, logger)
+            )
+            for scraper in scrapers
+        ]
+        await consume_jobs(queue, len(producers), job_filter, seen_jobs, flush, logger)
+        await asyncio.gather(*producers, return_exceptions=True)
             
     except Exception as e:
         logger.error(f"An error occurred: {str(e)}")
         raise
 
+async def run() -> None:
+    """Run the notifier once and release pooled scraper and SMTP resources"""
+    try:
+        await main()
+    finally:
+        await close_scrapers()
+        await asyncio.to_thread(EmailNotifier.close_pool)
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    asyncio.run(run())
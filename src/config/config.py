@@ -2,11 +2,21 @@
 Configuration settings for the Job Alert Notifier
 """
 import os
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict, List, Tuple
 from dataclasses import dataclass
 from dotenv import load_dotenv
 
-@dataclass
+_dotenv_loaded = False
+
+def _load_env() -> None:
+    """Load the .env file into the environment, only on the first call"""
+    global _dotenv_loaded
+    if not _dotenv_loaded:
+        load_dotenv()
+        _dotenv_loaded = True
+
+@dataclass(frozen=True, slots=True)
 class EmailConfig:
     """Email configuration settings"""
     smtp_server: str
@@ -14,12 +24,29 @@ class EmailConfig:
     sender_email: str
     sender_password: str
     recipient_email: str
+    
+    def validate(self) -> None:
+        """
+        Check that the settings are complete and well-formed
+        
+        Raises:
+            ValueError: If a setting is missing or invalid
+        """
+        if not all([self.smtp_server, self.smtp_port, self.sender_email,
+                    self.sender_password, self.recipient_email]):
+            raise ValueError("All email configuration parameters must be provided")
+            
+        if not isinstance(self.smtp_port, int) or self.smtp_port <= 0:
+            raise ValueError("SMTP port must be a positive integer")
+            
+        if "@" not in self.sender_email or "@" not in self.recipient_email:
+            raise ValueError("Invalid email address format")
 
 @dataclass
 class ScraperConfig:
     """Scraper configuration settings"""
-    keywords: List[str]
-    locations: List[str]
+    keywords: Tuple[str, ...]
+    locations: Tuple[str, ...]
     check_interval: int  # in hours
     max_results_per_site: int
 
@@ -29,10 +56,17 @@ class Config:
     email: EmailConfig
     scraper: ScraperConfig
     log_file: str
+    seen_jobs_file: str  # Bloom filter of job URLs already notified about
 
+@lru_cache(maxsize=1)
 def load_config() -> Config:
-    """Load configuration from environment variables"""
-    load_dotenv()
+    """
+    Load configuration from environment variables
+    
+    The result is cached, so repeated calls return the same Config instance
+    without re-reading the .env file. Treat the returned Config as read-only.
+    """
+    _load_env()
     
     email_config = EmailConfig(
         smtp_server=os.getenv("SMTP_SERVER", "smtp.gmail.com"),
@@ -43,8 +77,8 @@ def load_config() -> Config:
     )
     
     scraper_config = ScraperConfig(
-        keywords=os.getenv("KEYWORDS", "python,developer").split(","),
-        locations=os.getenv("LOCATIONS", "remote").split(","),
+        keywords=tuple(os.getenv("KEYWORDS", "python,developer").split(",")),
+        locations=tuple(os.getenv("LOCATIONS", "remote").split(",")),
         check_interval=int(os.getenv("CHECK_INTERVAL", "24")),
         max_results_per_site=int(os.getenv("MAX_RESULTS", "10"))
     )
@@ -52,5 +86,6 @@ def load_config() -> Config:
     return Config(
         email=email_config,
         scraper=scraper_config,
-        log_file="logs/job_alert.log"
+        log_file="logs/job_alert.log",
+        seen_jobs_file=os.getenv("SEEN_JOBS_FILE", "cache/seen_jobs.bloom")
     ) 
\ No newline at end of file
@@ -4,9 +4,8 @@ Base notification class with enhanced logging and extensibility
 from abc import ABC, abstractmethod
 from enum import Enum
 from typing import List, Optional
-import os
+import logging
 from src.scrapers.base import JobPosting
-from src.utils.logger import setup_logger
 
 class FormatType(Enum):
     """Enumeration of supported message format types"""
@@ -27,48 +26,22 @@ class BaseNotifier(ABC):
         format_type: Message format type (text, markdown, html)
     """
     
-    def __init__(self, 
-                 log_file: str = "logs/notifications.log",
-                 format_type: FormatType = FormatType.TEXT) -> None:
+    def __init__(self, format_type: FormatType = FormatType.TEXT) -> None:
         """
-        Initialize base notifier with logging setup
+        Initialize base notifier with the shared notification logger
         
         Args:
-            log_file: Path to log file
             format_type: Message format type to use
-            
-        Raises:
-            NotificationError: If logger setup fails
-        """
-        try:
-            # Ensure log directory exists
-            os.makedirs(os.path.dirname(log_file), exist_ok=True)
-            self.logger = setup_logger(log_file)
-            self.format_type = format_type
-            
-            self.logger.info(
-                f"Initialized {self.__class__.__name__} with {format_type.value} formatting"
-            )
-            
-        except Exception as e:
-            raise NotificationError(f"Failed to initialize notifier: {str(e)}")
-            
-    def __init_subclass__(cls, **kwargs):
-        """
-        Validate that child classes implement required methods
-        
-        Raises:
-            TypeError: If required methods are not implemented
         """
-        super().__init_subclass__(**kwargs)
+        # Child of the application logger, so records go through its handlers
+        self.logger = logging.getLogger(
+            f"JobAlertNotifier.notifications.{self.__class__.__name__}"
+        )
+        self.format_type = format_type
         
-        # Check for send_notification implementation
-        if not any(
-            'send_notification' in B.__dict__ for B in [cls] + list(cls.__bases__)
-        ):
-            raise TypeError(
-                f"{cls.__name__} must implement send_notification method"
-            )
+        self.logger.info(
+            f"Initialized {self.__class__.__name__} with {format_type.value} formatting"
+        )
             
     def prepare_notification(self, jobs: List[JobPosting]) -> str:
         """
@@ -116,51 +89,51 @@ class BaseNotifier(ABC):
             
     def _format_text(self, jobs: List[JobPosting]) -> str:
         """Format message in plain text"""
-        message = "New Job Matches Found!\n\n"
+        parts = ["New Job Matches Found!\n\n"]
         
         for job in jobs:
-            message += f"Company: {job.company}\n"
-            message += f"Title: {job.title}\n"
-            message += f"Location: {job.location or 'Not specified'}\n"
+            parts.append(f"Company: {job.company}\n")
+            parts.append(f"Title: {job.title}\n")
+            parts.append(f"Location: {job.location or 'Not specified'}\n")
             if job.salary:
-                message += f"Salary: {job.salary}\n"
+                parts.append(f"Salary: {job.salary}\n")
             if job.url:
-                message += f"URL: {job.url}\n"
-            message += "-" * 40 + "\n\n"
+                parts.append(f"URL: {job.url}\n")
+            parts.append("-" * 40 + "\n\n")
             
-        return message
+        return "".join(parts)
         
     def _format_markdown(self, jobs: List[JobPosting]) -> str:
         """Format message in Markdown"""
-        message = "**🔍 New Job Matches Found!**\n\n"
+        parts = ["**🔍 New Job Matches Found!**\n\n"]
         
         for job in jobs:
-            message += f"**{job.title}**\n"
-            message += f"🏢 *{job.company}*\n"
-            message += f"📍 {job.location or 'Not specified'}\n"
+            parts.append(f"**{job.title}**\n")
+            parts.append(f"🏢 *{job.company}*\n")
+            parts.append(f"📍 {job.location or 'Not specified'}\n")
             if job.salary:
-                message += f"💰 {job.salary}\n"
+                parts.append(f"💰 {job.salary}\n")
             if job.url:
-                message += f"🔗 [View Job]({job.url})\n"
-            message += "---\n\n"
+                parts.append(f"🔗 [View Job]({job.url})\n")
+            parts.append("---\n\n")
             
-        return message
+        return "".join(parts)
         
     def _format_html(self, jobs: List[JobPosting]) -> str:
         """Format message in HTML"""
-        message = "<h2>🔍 New Job Matches Found!</h2>\n\n"
+        parts = ["<h2>🔍 New Job Matches Found!</h2>\n\n"]
         
         for job in jobs:
-            message += f"<h3>{job.title}</h3>\n"
-            message += f"<p><strong>Company:</strong> {job.company}</p>\n"
-            message += f"<p><strong>Location:</strong> {job.location or 'Not specified'}</p>\n"
+            parts.append(f"<h3>{job.title}</h3>\n")
+            parts.append(f"<p><strong>Company:</strong> {job.company}</p>\n")
+            parts.append(f"<p><strong>Location:</strong> {job.location or 'Not specified'}</p>\n")
             if job.salary:
-                message += f"<p><strong>Salary:</strong> {job.salary}</p>\n"
+                parts.append(f"<p><strong>Salary:</strong> {job.salary}</p>\n")
             if job.url:
-                message += f"<p><a href='{job.url}'>View Job</a></p>\n"
-            message += "<hr>\n\n"
+                parts.append(f"<p><a href='{job.url}'>View Job</a></p>\n")
+            parts.append("<hr>\n\n")
             
-        return message
+        return "".join(parts)
         
     def log_job_details(self, jobs: List[JobPosting]) -> None:
         """
@@ -169,18 +142,20 @@ class BaseNotifier(ABC):
         Args:
             jobs: List of job postings to log
         """
+        # Skip building per-job messages entirely unless DEBUG is enabled
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
+            
         if not jobs:
             self.logger.debug("No jobs to log")
             return
             
-        self.logger.debug(f"Logging details for {len(jobs)} jobs:")
+        self.logger.debug("Logging details for %d jobs:", len(jobs))
         for i, job in enumerate(jobs, 1):
             self.logger.debug(
-                f"Job {i}/{len(jobs)}:\n"
-                f"  Title: {job.title}\n"
-                f"  Company: {job.company}\n"
-                f"  Location: {job.location or 'Not specified'}\n"
-                f"  URL: {job.url or 'Not available'}"
+                "Job %d/%d:\n  Title: %s\n  Company: %s\n  Location: %s\n  URL: %s",
+                i, len(jobs), job.title, job.company,
+                job.location or 'Not specified', job.url or 'Not available'
             )
             
     @abstractmethod
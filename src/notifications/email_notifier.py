@@ -2,13 +2,20 @@
 Email notification implementation with retry logic and connection optimization
 """
 import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from typing import List, Dict, Tuple, Optional
-from datetime import datetime, timedelta
+import email.policy
+from email.message import EmailMessage
+from typing import List, Dict, NamedTuple, Tuple, Optional
+from datetime import datetime
+import atexit
+import queue
+import threading
+from dataclasses import dataclass
+from html import escape
+from string import Template
+import random
 import socket
 import time
-from functools import wraps
+from functools import lru_cache, wraps
 from smtplib import (
     SMTPException,
     SMTPAuthenticationError,
@@ -21,22 +28,171 @@ from smtplib import (
     SMTPRecipientsRefused
 )
 from .base import BaseNotifier
+from src.config.config import EmailConfig
 from src.scrapers.base import JobPosting
 
+# Socket options for the SMTP connection: disable Nagle's algorithm so the
+# small command/response exchanges aren't delayed, and enable keepalive so
+# a cached connection notices half-open peers
+SOCKET_OPTIONS = [
+    (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+
+# Maximum number of description characters included per job
+DESCRIPTION_PREVIEW_LENGTH = 500
+
+# Table row for a single job in the HTML email
+JOB_ROW_TEMPLATE = Template("""
+                <tr>
+                    <td>
+                        <div class="job-title">$title</div>
+                        <div class="company-name">$company</div>
+                    </td>
+                    <td class="location">$location</td>
+                    <td class="date">$date</td>
+                    <td><a href="$url" class="view-job">View Job</a></td>
+                </tr>
+""")
+
+# Detailed description block for a single job in the HTML email. The job
+# number goes between the head and the template, so the templated part
+# doesn't depend on the job's position and can be cached.
+JOB_DETAIL_HEAD = """
+                <div style="margin-bottom: 30px;">
+                    <h3>"""
+JOB_DETAIL_TEMPLATE = Template(""". $title</h3>
+                    <div class="company-name">Company: $company</div>
+                    <div class="location">Location: $location</div>
+                    <div class="date">Posted: $date</div>
+                    <div class="description">
+                        <h4>Description:</h4>
+                        <p>$description</p>
+                    </div>
+                    <a href="$url" class="view-job">View Full Job Details</a>
+                </div>
+                <hr>
+""")
+
+class RenderedJob(NamedTuple):
+    """Email fragments for one job, without its position-dependent number"""
+    plain: str
+    html_row: str
+    html_detail: str
+
+@lru_cache(maxsize=1024)
+def _render_job(title: Optional[str], company: Optional[str], location: Optional[str],
+                date: Optional[str], url: Optional[str],
+                description: Optional[str]) -> RenderedJob:
+    """
+    Render a job's plain text and HTML fragments
+    
+    Cached on the job fields, so the same job included in a retried or
+    repeated notification is only truncated, escaped and templated once.
+    
+    Missing fields are rendered as empty text, or "Not specified" for the
+    location, rather than failing the whole email.
+    
+    Args:
+        title: Job title
+        company: Company name
+        location: Job location
+        date: Posting date (or placeholder text)
+        url: Job URL
+        description: Full job description
+        
+    Returns:
+        RenderedJob: Plain text block, HTML table row and HTML detail block
+    """
+    title = title or ""
+    company = company or ""
+    location = location or "Not specified"
+    date = date or ""
+    url = url or ""
+    description = description or ""
+    
+    if len(description) > DESCRIPTION_PREVIEW_LENGTH:
+        description = description[:DESCRIPTION_PREVIEW_LENGTH] + "..."
+        
+    plain = "\n".join([
+        title,
+        f"Company: {company}",
+        f"Location: {location}",
+        f"Posted: {date}",
+        f"URL: {url}",
+        "\nDescription:",
+        description,
+        "-" * 80
+    ])
+    
+    fields = {
+        "title": escape(title),
+        "company": escape(company),
+        "location": escape(location),
+        "date": escape(date),
+        "url": escape(url),
+        "description": escape(description),
+    }
+    return RenderedJob(
+        plain,
+        JOB_ROW_TEMPLATE.substitute(fields),
+        JOB_DETAIL_TEMPLATE.substitute(fields)
+    )
+
 class EmailNotifierError(Exception):
     """Base exception for email notification errors"""
     pass
 
+@dataclass
+class PooledConnection:
+    """Authenticated SMTP connection with usage bookkeeping for the pool"""
+    connection: smtplib.SMTP
+    opened_at: float
+    messages_sent: int = 0
+
+def _downgrade_to_7bit(msg: EmailMessage) -> EmailMessage:
+    """
+    Re-encode 8bit text parts for servers without 8BITMIME support
+    
+    The quoted-printable encoding is requested explicitly: the parts inherit
+    email.policy.SMTP, whose cte_type is 8bit, so leaving it to set_content
+    would pick 8bit again for short non-ASCII parts.
+    
+    Args:
+        msg: Multipart message built with 8bit parts
+        
+    Returns:
+        EmailMessage: The same message with 7bit-safe transfer encodings
+    """
+    for part in msg.iter_parts():
+        part.set_content(part.get_content(), subtype=part.get_content_subtype(),
+                         charset='utf-8', cte='quoted-printable')
+    return msg
+
+def _quit_quietly(connection: smtplib.SMTP) -> None:
+    """Close an SMTP connection, ignoring errors from an already dead socket"""
+    try:
+        connection.quit()
+    except Exception:
+        connection.close()
+
 def retry_smtp(max_tries: int = 3, delay: int = 2, backoff: float = 1.5, 
-               exceptions: tuple = (SMTPException, socket.error)):
+               exceptions: tuple = (SMTPException, socket.error),
+               max_total: float = 30.0):
     """
     Retry decorator for SMTP operations
     
+    Delays are randomized (50-150% of the nominal delay) so retries from
+    several senders don't synchronize, and the total time spent waiting is
+    capped at max_total seconds.
+    
     Args:
         max_tries: Maximum number of retry attempts
         delay: Initial delay between retries in seconds
         backoff: Multiplier for delay between retries
         exceptions: Tuple of exceptions to catch and retry
+        max_total: Maximum seconds from the first attempt after which no
+            further retry is started
         
     Returns:
         Decorated function
@@ -46,22 +202,25 @@ def retry_smtp(max_tries: int = 3, delay: int = 2, backoff: float = 1.5,
         def wrapper(self, *args, **kwargs):
             tries_remaining = max_tries
             current_delay = delay
+            deadline = time.monotonic() + max_total
             
             while tries_remaining > 0:
                 try:
                     return func(self, *args, **kwargs)
                 except exceptions as e:
                     tries_remaining -= 1
-                    if tries_remaining == 0:
+                    remaining_time = deadline - time.monotonic()
+                    if tries_remaining == 0 or remaining_time <= 0:
                         raise
                     
+                    sleep_time = min(current_delay * random.uniform(0.5, 1.5), remaining_time)
                     self.logger.warning(
-                        f"SMTP operation failed: {str(e)}. "
-                        f"Retrying in {current_delay} seconds... "
-                        f"({tries_remaining} tries remaining)"
+                        "SMTP operation failed: %s. Retrying in %.1f seconds... "
+                        "(%d tries remaining)",
+                        e, sleep_time, tries_remaining
                     )
                     
-                    time.sleep(current_delay)
+                    time.sleep(sleep_time)
                     current_delay *= backoff
             
             return False
@@ -72,40 +231,40 @@ class EmailNotifier(BaseNotifier):
     """Email notification system with retry logic and connection optimization"""
     
     # HTML email template
-    HTML_TEMPLATE = """
+    HTML_TEMPLATE = Template("""
     <!DOCTYPE html>
     <html>
     <head>
         <style>
-            body {{ font-family: Arial, sans-serif; line-height: 1.6; }}
-            table {{ border-collapse: collapse; width: 100%; margin: 20px 0; }}
-            th, td {{ padding: 12px; text-align: left; border-bottom: 1px solid #ddd; }}
-            th {{ background-color: #f5f5f5; }}
-            tr:hover {{ background-color: #f9f9f9; }}
-            .job-title {{ color: #2c5282; font-weight: bold; }}
-            .company-name {{ color: #444; }}
-            .location {{ color: #666; }}
-            .date {{ color: #888; font-size: 0.9em; }}
-            .description {{ color: #444; margin: 10px 0; }}
-            .view-job {{ 
+            body { font-family: Arial, sans-serif; line-height: 1.6; }
+            table { border-collapse: collapse; width: 100%; margin: 20px 0; }
+            th, td { padding: 12px; text-align: left; border-bottom: 1px solid #ddd; }
+            th { background-color: #f5f5f5; }
+            tr:hover { background-color: #f9f9f9; }
+            .job-title { color: #2c5282; font-weight: bold; }
+            .company-name { color: #444; }
+            .location { color: #666; }
+            .date { color: #888; font-size: 0.9em; }
+            .description { color: #444; margin: 10px 0; }
+            .view-job { 
                 display: inline-block;
                 padding: 5px 10px;
                 background-color: #3182ce;
                 color: white;
                 text-decoration: none;
                 border-radius: 4px;
-            }}
-            .view-job:hover {{
+            }
+            .view-job:hover {
                 background-color: #2b6cb0;
-            }}
-            .header {{ margin-bottom: 20px; }}
-            .footer {{ margin-top: 20px; color: #666; font-size: 0.9em; }}
+            }
+            .header { margin-bottom: 20px; }
+            .footer { margin-top: 20px; color: #666; font-size: 0.9em; }
         </style>
     </head>
     <body>
         <div class="header">
-            <h2>New Job Alerts ({job_count} matches)</h2>
-            <p>Found on {current_date}</p>
+            <h2>New Job Alerts ($job_count matches)</h2>
+            <p>Found on $current_date</p>
         </div>
         
         <table>
@@ -115,98 +274,170 @@ class EmailNotifier(BaseNotifier):
                 <th>Posted Date</th>
                 <th>Action</th>
             </tr>
-            {job_rows}
+            $job_rows
         </table>
         
         <div class="footer">
             <p>Job details and descriptions are provided below:</p>
-            {job_details}
+            $job_details
         </div>
     </body>
     </html>
-    """
+    """)
     
-    # Connection cache timeout (5 minutes)
-    CONNECTION_TIMEOUT = 300
+    # Reuse a pooled connection for up to 4 minutes, staying under the common
+    # 5 minute server idle timeout
+    CONNECTION_TIMEOUT = 240
     
-    def __init__(self, smtp_server: str, smtp_port: int, 
-                 sender_email: str, sender_password: str, 
-                 recipient_email: str):
-        """Initialize email notifier with connection caching"""
-        super().__init__()
+    # Maximum number of idle connections kept per server and account
+    POOL_SIZE = 4
+    
+    # Reopen connections after this many messages (providers cap messages per connection)
+    MAX_MESSAGES_PER_CONNECTION = 4000
+    
+    # Idle connections shared by all instances, keyed by (server, port, sender)
+    _pools: Dict[Tuple[str, int, str], "queue.LifoQueue[PooledConnection]"] = {}
+    _pools_lock = threading.Lock()
+    
+    def __init__(self, smtp_server: str = "", smtp_port: int = 0, 
+                 sender_email: str = "", sender_password: str = "", 
+                 recipient_email: str = "", config: Optional[EmailConfig] = None):
+        """
+        Initialize email notifier with pooled connections
         
-        # Validate input parameters
-        if not all([smtp_server, smtp_port, sender_email, sender_password, recipient_email]):
-            raise ValueError("All email configuration parameters must be provided")
-            
-        if not isinstance(smtp_port, int) or smtp_port <= 0:
-            raise ValueError("SMTP port must be a positive integer")
-            
-        if not "@" in sender_email or not "@" in recipient_email:
-            raise ValueError("Invalid email address format")
+        Args:
+            smtp_server: SMTP server host (ignored if config is given)
+            smtp_port: SMTP server port (ignored if config is given)
+            sender_email: Sender address and login (ignored if config is given)
+            sender_password: Sender password (ignored if config is given)
+            recipient_email: Recipient address (ignored if config is given)
+            config: Complete email settings
             
-        self.smtp_server = smtp_server
-        self.smtp_port = smtp_port
-        self.sender_email = sender_email
-        self.sender_password = sender_password
-        self.recipient_email = recipient_email
+        Raises:
+            ValueError: If the email settings are missing or invalid
+        """
+        super().__init__()
         
-        # Connection caching
-        self._smtp_connection: Optional[smtplib.SMTP] = None
-        self._last_connection_time: Optional[datetime] = None
+        if config is None:
+            config = EmailConfig(
+                smtp_server=smtp_server,
+                smtp_port=smtp_port,
+                sender_email=sender_email,
+                sender_password=sender_password,
+                recipient_email=recipient_email
+            )
+        config.validate()
+        self.config = config
         
-    def __del__(self):
-        """Cleanup SMTP connection on object destruction"""
-        self._close_connection()
+        # Connections are pooled per server and account across instances
+        self._pool_key = (config.smtp_server, config.smtp_port, config.sender_email)
         
-    def _close_connection(self) -> None:
-        """Safely close SMTP connection"""
-        if self._smtp_connection:
-            try:
-                self._smtp_connection.quit()
-            except Exception as e:
-                self.logger.warning(f"Error closing SMTP connection: {str(e)}")
-            finally:
-                self._smtp_connection = None
-                self._last_connection_time = None
+    def close(self) -> None:
+        """Close the pooled SMTP connections used by this notifier"""
+        self.close_pool(self._pool_key)
+        
+    def __enter__(self) -> "EmailNotifier":
+        """Use the notifier as a context manager that closes its connections on exit"""
+        return self
+        
+    def __exit__(self, *exc_info) -> None:
+        """Close the pooled SMTP connections used by this notifier"""
+        self.close()
+        
+    @classmethod
+    def close_pool(cls, key: Optional[Tuple[str, int, str]] = None) -> None:
+        """
+        Close idle pooled SMTP connections
+        
+        Args:
+            key: (smtp_server, smtp_port, sender_email) of the pool to close,
+                or None to close every pool
+        """
+        with cls._pools_lock:
+            if key is None:
+                pools = list(cls._pools.values())
+            else:
+                pools = [cls._pools[key]] if key in cls._pools else []
+                
+        for pool in pools:
+            while True:
+                try:
+                    pooled = pool.get_nowait()
+                except queue.Empty:
+                    break
+                _quit_quietly(pooled.connection)
                 
-    def _get_connection(self) -> smtplib.SMTP:
+    def _get_pool(self) -> "queue.LifoQueue[PooledConnection]":
+        """Get (or create) the connection pool for this notifier's server and account"""
+        with self._pools_lock:
+            pool = self._pools.get(self._pool_key)
+            if pool is None:
+                pool = queue.LifoQueue(maxsize=self.POOL_SIZE)
+                self._pools[self._pool_key] = pool
+            return pool
+                
+    def _get_connection(self) -> PooledConnection:
         """
-        Get SMTP connection, reusing existing one if valid
+        Check out an SMTP connection from the pool, opening one if needed
+        
+        Pooled connections are not probed; a dropped connection is detected
+        when sending and replaced there. Connections older than
+        CONNECTION_TIMEOUT, or that have sent MAX_MESSAGES_PER_CONNECTION
+        messages, are closed instead of reused.
         
         Returns:
-            smtplib.SMTP: Active SMTP connection
+            PooledConnection: Connection for the caller's exclusive use until
+                it is released or discarded
             
         Raises:
             SMTPException: If connection fails
         """
-        current_time = datetime.now()
+        pool = self._get_pool()
+        current_time = time.monotonic()
         
-        # Check if existing connection is valid and not expired
-        if (self._smtp_connection and self._last_connection_time and 
-            (current_time - self._last_connection_time).total_seconds() < self.CONNECTION_TIMEOUT):
+        # Reuse the most recently returned connection that is still fresh
+        while True:
             try:
-                # Test connection with NOOP
-                self._smtp_connection.noop()
-                return self._smtp_connection
-            except (SMTPException, socket.error):
-                self._close_connection()
+                pooled = pool.get_nowait()
+            except queue.Empty:
+                break
+            if (current_time - pooled.opened_at < self.CONNECTION_TIMEOUT and
+                pooled.messages_sent < self.MAX_MESSAGES_PER_CONNECTION):
+                return pooled
+            _quit_quietly(pooled.connection)
+        
+        # Create new connection
+        connection = smtplib.SMTP(self.config.smtp_server, self.config.smtp_port, timeout=30)
+        try:
+            # Options stay on the file descriptor when starttls() wraps the socket
+            self._set_socket_options(connection.sock)
+            connection.starttls()
+            connection.login(self.config.sender_email, self.config.sender_password)
+        except Exception:
+            _quit_quietly(connection)
+            raise
+            
+        return PooledConnection(connection, opened_at=current_time)
+
+    def _release_connection(self, pooled: PooledConnection) -> None:
+        """Return a healthy connection to the pool, closing it if the pool is full"""
+        try:
+            self._get_pool().put_nowait(pooled)
+        except queue.Full:
+            _quit_quietly(pooled.connection)
+
+    def _set_socket_options(self, sock: socket.socket) -> None:
+        """
+        Apply SOCKET_OPTIONS to the SMTP socket, skipping unsupported ones
         
-        # Create new connection if needed
-        if not self._smtp_connection:
+        Args:
+            sock: Connected SMTP socket
+        """
+        for level, option, value in SOCKET_OPTIONS:
             try:
-                connection = smtplib.SMTP(self.smtp_server, self.smtp_port, timeout=30)
-                connection.starttls()
-                connection.login(self.sender_email, self.sender_password)
-                
-                self._smtp_connection = connection
-                self._last_connection_time = current_time
-                
-            except Exception as e:
-                self._close_connection()
-                raise
-                
-        return self._smtp_connection
+                sock.setsockopt(level, option, value)
+            except OSError as e:
+                self.logger.debug("Could not set socket option %s: %s", option, e)
 
     def format_message(self, jobs: List[JobPosting]) -> Tuple[str, str]:
         """
@@ -222,86 +453,68 @@ class EmailNotifier(BaseNotifier):
             EmailNotifierError: If message formatting fails
         """
         try:
+            # Render each job's fragments once for both versions
+            prepared = self._prepare_jobs(jobs)
+            
             # Format plain text version
-            plain_text = self._format_plain_text(jobs)
+            plain_text = self._format_plain_text(prepared)
             
             # Format HTML version
-            html = self._format_html(jobs)
+            html = self._format_html(prepared)
             
             return plain_text, html
             
         except Exception as e:
-            self.logger.error(f"Error formatting email message: {str(e)}")
+            self.logger.error("Error formatting email message: %s", e)
             raise EmailNotifierError(f"Failed to format email message: {str(e)}")
 
-    def _format_plain_text(self, jobs: List[JobPosting]) -> str:
-        """Format jobs as plain text"""
-        lines = ["New Job Matches:\n"]
+    def _prepare_jobs(self, jobs: List[JobPosting]) -> List[RenderedJob]:
+        """
+        Render each job's email fragments, reusing cached renders
         
-        for i, job in enumerate(jobs, 1):
-            lines.extend([
-                f"\n{i}. {job.title}",
-                f"Company: {job.company}",
-                f"Location: {job.location}",
-                f"Posted: {job.posted_date or 'Date not available'}",
-                f"URL: {job.url}",
-                "\nDescription:",
-                job.description[:500] + "..." if len(job.description) > 500 else job.description,
-                "-" * 80
-            ])
+        Args:
+            jobs: List of JobPosting objects
             
+        Returns:
+            List of rendered plain text and HTML fragments, one per job
+        """
+        return [
+            _render_job(
+                job.title, job.company, job.location,
+                job.posted_date or 'Date not available', job.url, job.description
+            )
+            for job in jobs
+        ]
+
+    def _format_plain_text(self, jobs: List[RenderedJob]) -> str:
+        """Format rendered jobs as plain text"""
+        lines = ["New Job Matches:\n"]
+        lines.extend(f"\n{i}. {job.plain}" for i, job in enumerate(jobs, 1))
         return "\n".join(lines)
 
-    def _format_html(self, jobs: List[JobPosting]) -> str:
-        """Format jobs as HTML"""
-        job_rows = []
-        job_details = []
-        
-        for i, job in enumerate(jobs, 1):
-            # Format table row
-            job_rows.append(f"""
-                <tr>
-                    <td>
-                        <div class="job-title">{job.title}</div>
-                        <div class="company-name">{job.company}</div>
-                    </td>
-                    <td class="location">{job.location}</td>
-                    <td class="date">{job.posted_date or 'Date not available'}</td>
-                    <td><a href="{job.url}" class="view-job">View Job</a></td>
-                </tr>
-            """)
-            
-            # Format detailed description
-            job_details.append(f"""
-                <div style="margin-bottom: 30px;">
-                    <h3>{i}. {job.title}</h3>
-                    <div class="company-name">Company: {job.company}</div>
-                    <div class="location">Location: {job.location}</div>
-                    <div class="date">Posted: {job.posted_date or 'Date not available'}</div>
-                    <div class="description">
-                        <h4>Description:</h4>
-                        <p>{job.description[:500] + "..." if len(job.description) > 500 else job.description}</p>
-                    </div>
-                    <a href="{job.url}" class="view-job">View Full Job Details</a>
-                </div>
-                <hr>
-            """)
+    def _format_html(self, jobs: List[RenderedJob]) -> str:
+        """Format rendered jobs as HTML"""
+        job_rows = [job.html_row for job in jobs]
+        job_details = [
+            f"{JOB_DETAIL_HEAD}{i}{job.html_detail}" for i, job in enumerate(jobs, 1)
+        ]
         
         # Fill template
-        html = self.HTML_TEMPLATE.format(
+        html = self.HTML_TEMPLATE.substitute(
             job_count=len(jobs),
             current_date=datetime.now().strftime("%Y-%m-%d %H:%M"),
-            job_rows="\n".join(job_rows),
-            job_details="\n".join(job_details)
+            job_rows="".join(job_rows),
+            job_details="".join(job_details)
         )
         
         return html
 
-    @retry_smtp(max_tries=3, delay=2)
     def send_notification(self, jobs: List[JobPosting]) -> bool:
         """
         Send email notification with retry logic and connection reuse
         
+        The message is built once; only the transmission is retried.
+        
         Args:
             jobs: List of JobPosting objects to notify about
             
@@ -316,35 +529,93 @@ class EmailNotifier(BaseNotifier):
             self.logger.warning("No jobs provided for notification")
             return False
             
-        try:
-            # Create message
-            msg = MIMEMultipart('alternative')
-            msg['From'] = self.sender_email
-            msg['To'] = self.recipient_email
-            msg['Subject'] = f"New Job Alerts ({len(jobs)} matches)"
+        msg = self._build_message(jobs)
+        return self._transmit(msg, len(jobs))
+
+    def _build_message(self, jobs: List[JobPosting]) -> EmailMessage:
+        """
+        Build the multipart email for a list of jobs
+        
+        Args:
+            jobs: List of JobPosting objects to include
             
-            # Add both plain text and HTML versions
-            plain_text, html = self.format_message(jobs)
-            msg.attach(MIMEText(plain_text, 'plain'))
-            msg.attach(MIMEText(html, 'html'))
+        Returns:
+            EmailMessage: Message with plain text and HTML alternatives
             
-            # Get connection and send message
-            connection = self._get_connection()
-            connection.send_message(msg)
+        Raises:
+            EmailNotifierError: If message formatting fails
+        """
+        # 8bit parts skip quoted-printable/base64 encoding
+        msg = EmailMessage(policy=email.policy.SMTP)
+        msg['From'] = self.config.sender_email
+        msg['To'] = self.config.recipient_email
+        msg['Subject'] = f"New Job Alerts ({len(jobs)} matches)"
+        
+        # Add both plain text and HTML versions
+        plain_text, html = self.format_message(jobs)
+        msg.set_content(plain_text, subtype='plain', charset='utf-8', cte='8bit')
+        msg.add_alternative(html, subtype='html', charset='utf-8', cte='8bit')
+        return msg
+
+    def _send(self, connection: smtplib.SMTP, msg: EmailMessage) -> None:
+        """
+        Send a message, declaring its 8bit body if the server supports it
+        
+        Args:
+            connection: Authenticated SMTP connection
+            msg: Message built with 8bit parts
+        """
+        if connection.has_extn('8bitmime'):
+            connection.send_message(msg, mail_options=('BODY=8BITMIME',))
+        else:
+            self.logger.debug("SMTP server lacks 8BITMIME, re-encoding message parts")
+            connection.send_message(_downgrade_to_7bit(msg))
+
+    @retry_smtp(max_tries=3, delay=2)
+    def _transmit(self, msg: EmailMessage, job_count: int) -> bool:
+        """
+        Send a built message over a pooled SMTP connection
+        
+        Args:
+            msg: Message to send
+            job_count: Number of jobs in the message, for logging
             
-            self.logger.info(f"Successfully sent email notification for {len(jobs)} jobs")
+        Returns:
+            bool: True if the message was sent successfully
+            
+        Raises:
+            SMTPException: If sending fails
+            EmailNotifierError: For unexpected errors
+        """
+        pooled = self._get_connection()
+        try:
+            try:
+                self._send(pooled.connection, msg)
+            except (SMTPServerDisconnected, BrokenPipeError, ConnectionResetError):
+                # Pooled connection was dropped by the server; reconnect once
+                self.logger.info("SMTP connection was closed by the server, reconnecting")
+                _quit_quietly(pooled.connection)
+                pooled = self._get_connection()
+                self._send(pooled.connection, msg)
+            
+            pooled.messages_sent += 1
+            self._release_connection(pooled)
+            self.logger.info("Successfully sent email notification for %d jobs", job_count)
             return True
             
         except SMTPServerDisconnected:
-            self._close_connection()
+            _quit_quietly(pooled.connection)
             raise
             
         except (SMTPException, socket.error) as e:
-            self.logger.error(f"Error sending email: {str(e)}")
-            self._close_connection()
+            self.logger.error("Error sending email: %s", e)
+            _quit_quietly(pooled.connection)
             raise
             
         except Exception as e:
-            self.logger.error(f"Unexpected error: {str(e)}")
-            self._close_connection()
+            self.logger.error("Unexpected error: %s", e)
+            _quit_quietly(pooled.connection)
             raise EmailNotifierError(f"Failed to send email notification: {str(e)}")
+
+# Close pooled connections when the interpreter exits
+atexit.register(EmailNotifier.close_pool)
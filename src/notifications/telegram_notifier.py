@@ -1,51 +1,142 @@
 """
 Telegram notification implementation with enhanced error handling and type safety
 """
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
+import asyncio
+import inspect
+import re
 import time
 from functools import wraps
 from telegram import Bot
 from telegram.constants import ParseMode
-from telegram.error import TelegramError, NetworkError, TimedOut
+from telegram.error import BadRequest, RetryAfter, TelegramError, NetworkError, TimedOut
+from telegram.request import HTTPXRequest
 from .base import BaseNotifier
 from src.scrapers.base import JobPosting
+from src.utils.rate_limit import AsyncRateLimiter
 import html
 
+# Maximum number of Telegram messages in flight at once
+MAX_CONCURRENT_SENDS = 5
+
+# Telegram flood limits: about 30 messages per second overall and one
+# message per second to the same chat
+GLOBAL_MESSAGES_PER_SECOND = 30
+CHAT_MESSAGES_PER_SECOND = 1
+
+# Maximum number of times a message is re-sent after a RetryAfter response
+MAX_FLOOD_WAITS = 3
+
+_global_limiter = AsyncRateLimiter(GLOBAL_MESSAGES_PER_SECOND)
+_chat_limiters: Dict[str, AsyncRateLimiter] = {}
+
+# Markdown link: [text](url)
+_LINK_PATTERN = re.compile(r'\[([^\]]+)\]\(([^\)]+)\)')
+
+# Markdown special characters, and a translation table prefixing each with a backslash
+_MDV2_CHARS = frozenset(r"_*[]()~`>#+-=|{}.!")
+_MDV2_TRANS = str.maketrans({c: "\\" + c for c in _MDV2_CHARS})
+
+# Longest escaped text of a job field, and of its URL, in an HTML message.
+# Together with the labels they keep any single job well below
+# MAX_MESSAGE_LENGTH, so _pack_messages never produces an oversized message.
+MAX_FIELD_LENGTH = 300
+MAX_URL_LENGTH = 2048
+
+# Texts up to this length are checked for special characters before escaping;
+# past it str.translate alone is cheaper than the set scan
+_ESCAPE_FAST_PATH_MAX_LENGTH = 48
+
+def _escape_html(text: Optional[str], max_length: int = MAX_FIELD_LENGTH) -> str:
+    """
+    HTML-escape text, shortening it so the escaped result fits in max_length
+    
+    The raw text is cut rather than the escaped one, so no entity is split.
+    
+    Args:
+        text: Text to escape, may be None
+        max_length: Maximum length of the escaped result
+        
+    Returns:
+        str: Escaped text, ending in "…" if it was shortened
+    """
+    escaped = html.escape(text or "")
+    if len(escaped) <= max_length:
+        return escaped
+        
+    parts: List[str] = []
+    length = 1  # Room for the ellipsis
+    for char in text:
+        char_escaped = html.escape(char)
+        length += len(char_escaped)
+        if length > max_length:
+            break
+        parts.append(char_escaped)
+    return "".join(parts) + "…"
+
 def retry_on_telegram_error(max_retries: int = 3, delay: int = 2):
     """
     Decorator to retry operations on Telegram API errors
     
+    Works on both coroutine functions and regular functions. Coroutines wait
+    between attempts with asyncio.sleep, so the event loop keeps serving
+    other tasks during the backoff. The wait doubles after every failed
+    attempt. RetryAfter is re-raised at once so the caller can wait the
+    time Telegram asks for under its own rate limits.
+    
     Args:
         max_retries: Maximum number of retry attempts
-        delay: Delay between retries in seconds
+        delay: Delay before the first retry in seconds
         
     Returns:
         Decorated function with retry logic
     """
+    def backoff(attempt: int) -> float:
+        """Seconds to wait after the given failed attempt"""
+        return delay * 2 ** attempt
+        
+    def should_retry(self, attempt: int, error: TelegramError) -> bool:
+        """Log a failed attempt and decide whether to try again"""
+        if isinstance(error, RetryAfter):
+            # Flood waits are handled by the caller's rate limiting
+            return False
+        # BadRequest subclasses NetworkError but is never transient
+        if isinstance(error, BadRequest) or not isinstance(error, (NetworkError, TimedOut)):
+            # Don't retry on non-transient errors
+            self.logger.error("Non-retryable Telegram error: %s", error)
+            return False
+        if attempt >= max_retries - 1:
+            return False
+        self.logger.warning(
+            "Attempt %d/%d failed. Retrying in %s seconds... Error: %s",
+            attempt + 1, max_retries, backoff(attempt), error
+        )
+        return True
+        
     def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(self, *args, **kwargs):
+                for attempt in range(max_retries):
+                    try:
+                        return await func(self, *args, **kwargs)
+                    except TelegramError as e:
+                        if not should_retry(self, attempt, e):
+                            raise
+                        await asyncio.sleep(backoff(attempt))
+                        
+            return async_wrapper
+            
         @wraps(func)
         def wrapper(self, *args, **kwargs):
-            last_error = None
-            
             for attempt in range(max_retries):
                 try:
                     return func(self, *args, **kwargs)
-                except (NetworkError, TimedOut) as e:
-                    last_error = e
-                    if attempt < max_retries - 1:
-                        self.logger.warning(
-                            f"Attempt {attempt + 1}/{max_retries} failed. "
-                            f"Retrying in {delay} seconds... Error: {str(e)}"
-                        )
-                        time.sleep(delay)
-                    continue
                 except TelegramError as e:
-                    # Don't retry on non-transient errors
-                    self.logger.error(f"Non-retryable Telegram error: {str(e)}")
-                    raise
+                    if not should_retry(self, attempt, e):
+                        raise
+                    time.sleep(backoff(attempt))
                     
-            raise last_error
-            
         return wrapper
     return decorator
 
@@ -66,7 +157,10 @@ class TelegramNotifier(BaseNotifier):
     
     MAX_MESSAGE_LENGTH: int = 4096
     TEST_MESSAGE: str = "🤖 Bot successfully initialized and connected!"
-    CHUNK_SIZE: int = 5  # Number of jobs per message
+    MESSAGE_HEADER: str = "<b>🔍 New Job Opportunities!</b>\n\n"
+    JOB_SEPARATOR: str = "\n\n" + "=" * 30 + "\n\n"
+    MARKDOWN_HEADER: str = "*🔍 New Job Postings Found!*\n\n"
+    MARKDOWN_SEPARATOR: str = "\n\n" + "-" * 30 + "\n\n"
     
     def __init__(self, bot_token: str, chat_id: str) -> None:
         """Initialize Telegram notifier"""
@@ -79,7 +173,12 @@ class TelegramNotifier(BaseNotifier):
         if not chat_id or not isinstance(chat_id, str):
             raise ValueError("Chat ID must be a non-empty string")
             
-        self.bot = Bot(token=bot_token)
+        # PTB's default request object holds a single connection, which would
+        # serialize the concurrent sends; size the pool to match them instead
+        self.bot = Bot(
+            token=bot_token,
+            request=HTTPXRequest(connection_pool_size=MAX_CONCURRENT_SENDS)
+        )
         self.chat_id = chat_id
         self.initialized = False
 
@@ -152,71 +251,160 @@ class TelegramNotifier(BaseNotifier):
             raise TelegramNotifierError(f"Validation failed: {str(e)}")
             
     @retry_on_telegram_error(max_retries=3, delay=2)
-    def _send_message_chunk(self, chunk: str) -> None:
+    async def _send_message_chunk(self, chunk: str, parse_mode: str = ParseMode.MARKDOWN) -> None:
         """
         Send a single message chunk to Telegram with retry logic
         
         Args:
             chunk: Message text to send
+            parse_mode: Telegram parse mode of the text
             
         Raises:
-            TelegramNotifierError: If message sending fails after retries
+            TelegramError: If message sending fails after retries
+            TelegramNotifierError: If the bot cannot be validated
         """
         if not self.initialized:
             self.logger.warning("Bot not initialized. Attempting to validate connection...")
-            self.validate_connection()
+            await self.validate_connection()
             
-        try:
-            self.bot.send_message(
-                chat_id=self.chat_id,
-                text=chunk,
-                parse_mode=ParseMode.MARKDOWN
-            )
-            self.logger.debug(f"Successfully sent message chunk of length {len(chunk)}")
+        await self.bot.send_message(
+            chat_id=self.chat_id,
+            text=chunk,
+            parse_mode=parse_mode,
+            disable_web_page_preview=True
+        )
+        self.logger.debug("Successfully sent message chunk of length %d", len(chunk))
             
-        except TelegramError as e:
-            raise TelegramNotifierError(f"Failed to send message: {str(e)}")
-            
-    @retry_on_telegram_error(max_retries=3, delay=2)
-    async def send_notification(self, jobs: List[JobPosting]) -> None:
+    async def send_notification(self, jobs: List[JobPosting]) -> bool:
         """Send job notifications via Telegram.
         
+        Jobs are packed into as few messages as the Telegram length limit
+        allows, and the messages are sent concurrently within Telegram's
+        flood limits. Each message is
+        retried on its own, so a transient failure never resends parts that
+        were already delivered.
+        
         Args:
             jobs (List[JobPosting]): List of jobs to send notifications for
+            
+        Returns:
+            bool: True if every message was delivered, False if there were no
+                jobs or any message failed after its retries
         """
         if not jobs:
-            return
+            self.logger.warning("No jobs provided for notification")
+            return False
         
-        self.logger.info(f"Sending notification for {len(jobs)} jobs in {(len(jobs) + self.CHUNK_SIZE - 1) // self.CHUNK_SIZE} chunks")
+        messages = self._pack_messages(jobs)
+        self.logger.info("Sending notification for %d jobs in %d messages", len(jobs), len(messages))
         
-        # Process jobs in chunks to avoid message length limits
-        chunks = [jobs[i:i + self.CHUNK_SIZE] for i in range(0, len(jobs), self.CHUNK_SIZE)]
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_SENDS)
         
-        for chunk in chunks:
-            message = self._format_jobs(chunk)
-            try:
-                await self.bot.send_message(
-                    chat_id=self.chat_id,
-                    text=message,
-                    parse_mode="HTML",
-                    disable_web_page_preview=True
-                )
-            except Exception as e:
-                self.logger.error(f"Failed to send Telegram notification: {str(e)}")
-                continue
+        async def send(message: str) -> bool:
+            async with semaphore:
+                try:
+                    await self._send_with_limits(message, ParseMode.HTML)
+                    return True
+                except Exception as e:
+                    self.logger.error("Failed to send Telegram notification: %s", e)
+                    return False
+        
+        results = await asyncio.gather(*(send(message) for message, _ in messages))
+        
+        undelivered = sum(job_count for (_, job_count), sent in zip(messages, results) if not sent)
+        if undelivered:
+            self.logger.error(
+                "Telegram notification failed for %d/%d parts; %d of %d jobs were not delivered",
+                len(messages) - sum(results), len(messages), undelivered, len(jobs)
+            )
+            return False
             
-        self.logger.info(f"Successfully sent Telegram notification in {len(chunks)} parts")
+        self.logger.info("Successfully sent Telegram notification in %d parts", len(messages))
+        return True
+
+    async def _send_with_limits(self, chunk: str, parse_mode: str = ParseMode.MARKDOWN) -> None:
+        """
+        Send a message chunk within the global and per-chat rate limits
+        
+        If Telegram still answers with RetryAfter, wait the requested time
+        and send again, up to MAX_FLOOD_WAITS times.
+        
+        Args:
+            chunk: Message text to send
+            parse_mode: Telegram parse mode of the text
+            
+        Raises:
+            TelegramError: If message sending fails after retries
+        """
+        chat_limiter = _chat_limiters.setdefault(
+            self.chat_id, AsyncRateLimiter(CHAT_MESSAGES_PER_SECOND)
+        )
+        
+        for flood_wait in range(MAX_FLOOD_WAITS + 1):
+            async with _global_limiter, chat_limiter:
+                try:
+                    await self._send_message_chunk(chunk, parse_mode)
+                    return
+                except RetryAfter as e:
+                    if flood_wait == MAX_FLOOD_WAITS:
+                        raise
+                    self.logger.warning("Telegram flood limit hit, waiting %s seconds", e.retry_after)
+                    retry_after = e.retry_after
+            await asyncio.sleep(retry_after)
+
+    def _pack_messages(self, jobs: List[JobPosting]) -> List[Tuple[str, int]]:
+        """
+        Pack formatted jobs into messages within the Telegram length limit
+        
+        Messages are split on job boundaries only. _format_job bounds the
+        length of each job, so every message fits within the limit.
+        
+        Args:
+            jobs: List of jobs to format
+            
+        Returns:
+            List[Tuple[str, int]]: Messages ready for sending, each with the
+                number of jobs it contains
+        """
+        header = self.MESSAGE_HEADER
+        separator = self.JOB_SEPARATOR
+        
+        messages: List[Tuple[str, int]] = []
+        current = header
+        job_count = 0
+        
+        for job in jobs:
+            job_text = self._format_job(job)
+            addition = separator + job_text if job_count else job_text
+            if job_count and len(current) + len(addition) > self.MAX_MESSAGE_LENGTH:
+                messages.append((current, job_count))
+                current = header + job_text
+                job_count = 0
+            else:
+                current += addition
+            job_count += 1
+            
+        if job_count:
+            messages.append((current, job_count))
+        return messages
 
-    def _split_message(self, message: str, chunk_size: Optional[int] = None) -> List[str]:
+    def _iter_chunks(self, message: str, chunk_size: Optional[int] = None) -> Iterator[str]:
         """
-        Split message into chunks while preserving Markdown formatting and message integrity
+        Lazily split a message into chunks while preserving Markdown formatting
+        
+        Chunks are cut at the last paragraph break, line break or space that
+        fits, falling back to a hard cut only when none exists. Only one chunk
+        is materialized at a time.
+        
+        Not used by send_notification, which packs whole HTML jobs into
+        messages with _pack_messages instead.
         
         Args:
             message: Original message text to split
             chunk_size: Optional custom chunk size (defaults to MAX_MESSAGE_LENGTH)
             
-        Returns:
-            List[str]: List of message chunks ready for sending
+        Yields:
+            str: Message chunks ready for sending
             
         Raises:
             ValueError: If chunk_size is invalid or message is empty
@@ -230,9 +418,9 @@ class TelegramNotifier(BaseNotifier):
             raise ValueError("Chunk size must be positive")
             
         if len(message) <= max_length:
-            return [message]
+            yield message
+            return
             
-        chunks: List[str] = []
         current_pos = 0
         
         while current_pos < len(message):
@@ -243,16 +431,9 @@ class TelegramNotifier(BaseNotifier):
                 max_length
             )
             
-            # Extract the chunk
-            chunk = message[current_pos:chunk_end]
-            
             # Ensure chunk has balanced Markdown
-            chunk = self._balance_markdown(chunk)
-            
-            chunks.append(chunk)
+            yield self._balance_markdown(message[current_pos:chunk_end])
             current_pos = chunk_end
-            
-        return chunks
 
     def _find_safe_split_point(self, message: str, start: int, max_length: int) -> int:
         """
@@ -277,9 +458,10 @@ class TelegramNotifier(BaseNotifier):
         break_chars = ['\n\n', '\n', ' ']
         
         for char in break_chars:
-            last_break = message[start:end].rfind(char)
-            if last_break != -1:
-                return start + last_break + len(char)
+            # Search in place rather than on a sliced copy of the window
+            last_break = message.rfind(char, start, end)
+            if last_break > start:
+                return last_break + len(char)
                 
         # If no natural break point, force split at max_length
         return end
@@ -319,6 +501,11 @@ class TelegramNotifier(BaseNotifier):
         """
         Format job postings into a Markdown-formatted message for Telegram
         
+        Not used by send_notification, which sends HTML messages built by
+        _format_job and _pack_messages. The Markdown helpers below
+        (_escape_markdown, _validate_markdown, _balance_markdown) only serve
+        this method and _iter_chunks.
+        
         Args:
             jobs: List of job postings to format
             
@@ -331,55 +518,53 @@ class TelegramNotifier(BaseNotifier):
         if not jobs:
             raise ValueError("Cannot format empty jobs list")
             
-        # Header for the notification
-        header = "*🔍 New Job Postings Found!*\n\n"
-        
-        # Format each job posting
-        job_sections: List[str] = []
+        # Build the whole message as one flat list of parts joined once
+        parts: List[str] = [self.MARKDOWN_HEADER]
         
         for job in jobs:
-            try:
-                # Escape special Markdown characters in text fields
-                title = self._escape_markdown(job.title)
-                company = self._escape_markdown(job.company)
-                location = self._escape_markdown(job.location) if job.location else "Remote/Unspecified"
-                salary = self._escape_markdown(job.salary) if job.salary else "Not specified"
+            # Postings without a title or company cannot be formatted at all
+            if job is None or not getattr(job, "title", None) or not getattr(job, "company", None):
+                self.logger.warning("Skipping malformed job posting: missing title or company")
+                continue
                 
-                # Build job section with proper Markdown formatting
-                job_section = [
-                    f"*{title}*",
-                    f" Company: {company}",
-                    f"📍 Location: {location}",
-                    f"💰 Salary: {salary}"
-                ]
+            if len(parts) > 1:
+                parts.append(self.MARKDOWN_SEPARATOR)
                 
-                # Add job link if available
-                if job.url:
-                    job_section.append(f"🔗 [View Job]({job.url})")
-                # Add job description preview if available
-                if job.description:
-                    # Truncate description to prevent overly long messages
-                    max_desc_length = 150
-                    description = self._escape_markdown(job.description)
-                    if len(description) > max_desc_length:
-                        description = f"{description[:max_desc_length]}..."
-                    job_section.append(f"📝 {description}")
-                    
-                # Add posting date if available
-                if job.posted_date:
-                    formatted_date = job.posted_date.strftime("%Y-%m-%d")
-                    job_section.append(f"📅 Posted: {formatted_date}")
-                    
-                # Combine job section with double newlines
-                job_sections.append("\n".join(job_section))
+            # Escape special Markdown characters in text fields
+            title = self._escape_markdown(job.title)
+            company = self._escape_markdown(job.company)
+            location = self._escape_markdown(job.location) if job.location else "Remote/Unspecified"
+            # JobPosting has no salary field; some sources attach one
+            salary = getattr(job, "salary", None)
+            salary = self._escape_markdown(salary) if salary else "Not specified"
+            
+            parts.append(
+                f"*{title}*\n Company: {company}\n📍 Location: {location}\n💰 Salary: {salary}"
+            )
+            
+            # Add job link if available
+            if job.url:
+                parts.append(f"\n🔗 [View Job]({job.url})")
+            # Add job description preview if available
+            if job.description:
+                # Truncate description to prevent overly long messages
+                max_desc_length = 150
+                # Escaping never shortens text, so only the part of the
+                # description that can survive truncation needs escaping
+                description = self._escape_markdown(job.description[:max_desc_length])
+                if len(job.description) > max_desc_length or len(description) > max_desc_length:
+                    description = f"{description[:max_desc_length]}..."
+                parts.append(f"\n📝 {description}")
                 
-            except AttributeError as e:
-                self.logger.warning(f"Skipping malformed job posting: {str(e)}")
-                continue
+            # Add posting date if available; scrapers store it as an ISO string
+            if job.posted_date:
+                formatted_date = (
+                    job.posted_date if isinstance(job.posted_date, str)
+                    else job.posted_date.strftime("%Y-%m-%d")
+                )
+                parts.append(f"\n📅 Posted: {formatted_date}")
                 
-        # Combine all sections with separators
-        separator = "\n\n" + "-" * 30 + "\n\n"
-        formatted_message = header + separator.join(job_sections)
+        formatted_message = "".join(parts)
         
         # Validate message length
         if len(formatted_message) > self.MAX_MESSAGE_LENGTH:
@@ -403,15 +588,11 @@ class TelegramNotifier(BaseNotifier):
         if not text:
             return ""
             
-        # Characters that need escaping in Markdown
-        markdown_chars = ['_', '*', '[', ']', '(', ')', '~', '`', '>', 
-                         '#', '+', '-', '=', '|', '{', '}', '.', '!']
-        
-        escaped_text = text
-        for char in markdown_chars:
-            escaped_text = escaped_text.replace(char, f"\\{char}")
+        # Short texts such as titles and company names rarely need escaping
+        if len(text) <= _ESCAPE_FAST_PATH_MAX_LENGTH and _MDV2_CHARS.isdisjoint(text):
+            return text
             
-        return escaped_text
+        return text.translate(_MDV2_TRANS)
 
     def _validate_markdown(self, text: str) -> bool:
         """
@@ -436,9 +617,7 @@ class TelegramNotifier(BaseNotifier):
                 return False
                 
             # Check for valid URLs in markdown links
-            import re
-            link_pattern = r'\[([^\]]+)\]\(([^\)]+)\)'
-            links = re.findall(link_pattern, text)
+            links = _LINK_PATTERN.findall(text)
             for _, url in links:
                 if not url.startswith(('http://', 'https://')):
                     return False
@@ -458,23 +637,27 @@ class TelegramNotifier(BaseNotifier):
         Returns:
             str: Formatted job posting text
         """
-        # Base job information
+        # Base job information; fields are shortened so the job always fits
+        # in one message
         job_text = [
-            f"<b>{html.escape(job.title)}</b>",
-            f"🏢 Company: {html.escape(job.company)}",
-            f"📍 Location: {html.escape(job.location)}",
+            f"<b>{_escape_html(job.title)}</b>",
+            f"🏢 Company: {_escape_html(job.company)}",
+            f"📍 Location: {_escape_html(job.location or 'Not specified')}",
         ]
         
         # Add salary if available
         if hasattr(job, "salary") and job.salary:
-            job_text.append(f"💰 Salary: {html.escape(job.salary)}")
+            job_text.append(f"💰 Salary: {_escape_html(job.salary)}")
         
         # Add posting date if available
         if hasattr(job, "posted_date") and job.posted_date:
-            job_text.append(f"📅 Posted: {job.posted_date}")
+            job_text.append(f"📅 Posted: {_escape_html(str(job.posted_date))}")
         
-        # Add job URL
-        job_text.append(f"\n🔗 <a href='{job.url}'>Apply Here</a>")
+        # Add job URL; a truncated URL would be a broken link, so leave out
+        # one that is too long
+        url = html.escape(job.url or "")
+        if url and len(url) <= MAX_URL_LENGTH:
+            job_text.append(f"\n🔗 <a href='{url}'>Apply Here</a>")
         
         return "\n".join(job_text)
 
@@ -492,9 +675,4 @@ class TelegramNotifier(BaseNotifier):
         
         # Format each job and join with separators
         job_messages = [self._format_job(job) for job in jobs]
-        separator = "\n\n" + "=" * 30 + "\n\n"
-        
-        # Add header
-        header = "<b>🔍 New Job Opportunities!</b>\n\n"
-        
-        return header + separator.join(job_messages)
+        return self.MESSAGE_HEADER + self.JOB_SEPARATOR.join(job_messages)
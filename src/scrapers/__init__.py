@@ -1,27 +1,65 @@
 """
 Scraper factory and initialization
 """
-from typing import List
+from functools import lru_cache
+from importlib import import_module
+from typing import Optional, Tuple, Type
+import logging
 from .base import BaseScraper
-from .bestjobs_ro import BestJobsRoScraper
-from .weworkremotely import WeWorkRemotelyScraper
-from .ejobs_ro import EJobsRoScraper
-from .hipo_ro import HipoRoScraper
-from .linkedin import LinkedInScraper
-from .remoteco import RemoteCoScraper
 
-def get_all_scrapers() -> List[BaseScraper]:
+# Scraper class name -> module defining it. Modules are imported on first use
+# so that importing the package does not load scrapers that are never run.
+_SCRAPER_MODULES = {
+    "BestJobsRoScraper": "bestjobs_ro",
+    "WeWorkRemotelyScraper": "weworkremotely",
+    "EJobsRoScraper": "ejobs_ro",
+    "HipoRoScraper": "hipo_ro",
+    "LinkedInScraper": "linkedin",
+    "RemoteCoScraper": "remoteco",
+}
+
+def __getattr__(name: str) -> Type[BaseScraper]:
+    """Import scraper classes lazily on attribute access"""
+    if name in _SCRAPER_MODULES:
+        return get_scraper_class(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def get_scraper_class(name: str) -> Type[BaseScraper]:
     """
-    Get instances of all available scrapers
+    Import and return a scraper class by name
+    
+    Args:
+        name: Scraper class name, e.g. "BestJobsRoScraper"
+    
+    Returns:
+        Scraper class
+    
+    Raises:
+        KeyError: If no scraper with that name exists
+    """
+    module = import_module(f".{_SCRAPER_MODULES[name]}", __name__)
+    return getattr(module, name)
+
+@lru_cache(maxsize=1)
+def get_all_scrapers(names: Optional[Tuple[str, ...]] = None) -> Tuple[BaseScraper, ...]:
+    """
+    Get instances of the named scrapers, creating them on first use
+    
+    Instances (and their HTTP connection pools) are reused across calls with
+    the same names. Scrapers that fail to import or initialize are logged and
+    skipped.
+    
+    Args:
+        names: Scraper class names to create, defaults to all available scrapers
     
     Returns:
-        List of scraper instances
+        Tuple of scraper instances
     """
-    return [
-        BestJobsRoScraper(),
-        WeWorkRemotelyScraper(),
-        EJobsRoScraper(),
-        HipoRoScraper(),
-        LinkedInScraper(),
-        RemoteCoScraper()
-    ]
+    logger = logging.getLogger("JobAlertNotifier")
+    scrapers = []
+    for name in names if names is not None else _SCRAPER_MODULES:
+        try:
+            scrapers.append(get_scraper_class(name)())
+        except Exception as scraper_error:
+            logger.error(f"Error initializing {name}: {str(scraper_error)}")
+    return tuple(scrapers)
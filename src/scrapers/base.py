@@ -2,11 +2,81 @@
 Base scraper class for job websites
 """
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import List, Optional
+import asyncio
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from hashlib import blake2b
+import logging
+import re
+import threading
+from typing import Any, Callable, Container, Iterable, Iterator, List, Optional, TypeVar
 import requests
-from bs4 import BeautifulSoup
-from src.utils.logger import setup_logger
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, SoupStrainer
+import lxml.etree
+import lxml.html
+from src.utils.rate_limit import RateLimiter
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Maximum number of requests a single scraper keeps in flight
+MAX_CONCURRENT_REQUESTS = 8
+
+# Seconds to wait for a server to connect or send data before giving up
+REQUEST_TIMEOUT = 10
+
+# Maximum number of job detail results each scraper keeps in memory
+DETAIL_CACHE_SIZE = 4096
+
+# Seconds to hold back a rate-limited scraper's requests after an HTTP 429
+# response that has no usable Retry-After header
+DEFAULT_RETRY_AFTER = 30
+
+# Connection pool shared by every scraper session so TCP/TLS connections
+# are kept alive and reused across scrapers and requests
+_SHARED_ADAPTER = HTTPAdapter(pool_connections=20, pool_maxsize=MAX_CONCURRENT_REQUESTS * 2)
+
+def class_strainer(name: str, *classes: str) -> SoupStrainer:
+    """
+    Build a SoupStrainer keeping name elements that have any of the given classes
+    
+    While parsing, SoupStrainer matches class_ against the raw attribute
+    value, so class_="card" would miss class="card featured". Matching the
+    class names as whitespace-delimited tokens works for both.
+    
+    Args:
+        name: Tag name to keep
+        classes: CSS class names, any of which selects the element
+        
+    Returns:
+        SoupStrainer for use as parse_only
+    """
+    pattern = re.compile(r"(?:^|\s)(?:%s)(?:\s|$)" % "|".join(map(re.escape, classes)))
+    return SoupStrainer(name, class_=pattern)
+
+def has_class(name: str) -> str:
+    """Build an XPath predicate matching elements whose class list contains name"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+# Text nodes under an element, leaving out script and style contents as
+# BeautifulSoup's get_text does
+_TEXT_XP = lxml.etree.XPath(
+    "descendant-or-self::text()[not(parent::script or parent::style)]",
+    smart_strings=False
+)
+
+def element_text(element) -> str:
+    """Concatenate an lxml element's stripped text nodes, like get_text(strip=True)"""
+    return "".join(text.strip() for text in _TEXT_XP(element))
+
+def _retry_after(response: requests.Response) -> float:
+    """Seconds to wait according to a response's Retry-After header, if given in seconds"""
+    try:
+        return max(0.0, float(response.headers["Retry-After"]))
+    except (KeyError, ValueError):
+        return DEFAULT_RETRY_AFTER
 
 @dataclass
 class JobPosting:
@@ -17,37 +87,207 @@ class JobPosting:
     url: str
     description: str
     posted_date: Optional[str] = None
+    # 64-bit hash of the URL used for cheap in-memory deduplication
+    url_hash: int = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        """Compute the URL hash once when the posting is created"""
+        self.url_hash = int.from_bytes(
+            blake2b((self.url or "").encode(), digest_size=8).digest(), "little"
+        )
 
 class BaseScraper(ABC):
     """Base class for job website scrapers"""
     
     def __init__(self, base_url: str, logger=None):
         self.base_url = base_url
-        self.logger = logger or setup_logger("logs/scraper.log")
+        # Child of the application logger configured once in main, so records
+        # go through its handlers
+        self.logger = logger or logging.getLogger(
+            f"JobAlertNotifier.scrapers.{self.__class__.__name__}"
+        )
         self.session = requests.Session()
+        self.session.mount("http://", _SHARED_ADAPTER)
+        self.session.mount("https://", _SHARED_ADAPTER)
         # Set a user agent to avoid being blocked
         self.session.headers.update({
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
         })
+        # LRU cache of job detail results by URL, shared by the fetch worker threads
+        self._detail_cache: "OrderedDict[str, Any]" = OrderedDict()
+        self._detail_cache_lock = threading.Lock()
+        # URLs of jobs handled in previous runs (e.g. a persisted Bloom filter);
+        # listings with these URLs are skipped before their detail page is fetched
+        self.known_urls: Container[str] = frozenset()
+        # Optional limiter applied to every request; subclasses set it for
+        # sites that throttle clients
+        self.rate_limiter: Optional[RateLimiter] = None
 
-    def _fetch_page(self, url: str) -> Optional[BeautifulSoup]:
+    def _fetch_page(self, url: str,
+                    parse_only: Optional[SoupStrainer] = None) -> Optional[BeautifulSoup]:
         """
         Fetch and parse a webpage
         
         Args:
             url: URL to fetch
+            parse_only: Optional strainer limiting the tree to matching elements,
+                so the rest of the page is never turned into nodes
             
         Returns:
             BeautifulSoup object or None if fetch fails
         """
+        html = self._fetch_html(url)
+        return BeautifulSoup(html, "lxml", parse_only=parse_only) if html is not None else None
+
+    def _fetch_tree(self, url: str) -> Optional[lxml.html.HtmlElement]:
+        """
+        Fetch a webpage and parse it into an lxml element tree
+        
+        Args:
+            url: URL to fetch
+            
+        Returns:
+            Root lxml element or None if fetch fails
+        """
+        html = self._fetch_html(url)
+        if not html:
+            return None
+        return self._parse_tree(html, url)
+
+    def _parse_tree(self, html: str, url: str) -> Optional[lxml.html.HtmlElement]:
+        """
+        Parse fetched HTML into an lxml element tree
+        
+        Args:
+            html: Page HTML
+            url: URL the HTML was fetched from, for error messages
+            
+        Returns:
+            Root lxml element or None if parsing fails
+        """
         try:
-            response = self.session.get(url)
+            try:
+                return lxml.html.fromstring(html)
+            except ValueError:
+                # lxml rejects str input with an <?xml ... encoding=...?> prolog.
+                # The text is already decoded, so parse it as UTF-8 bytes and
+                # override whatever encoding the prolog declares.
+                return lxml.html.fromstring(
+                    html.encode("utf-8"), parser=lxml.html.HTMLParser(encoding="utf-8")
+                )
+        except lxml.etree.ParserError as e:
+            self.logger.error(f"Error parsing {url}: {str(e)}")
+            return None
+
+    def _fetch_html(self, url: str) -> Optional[str]:
+        """
+        Fetch the raw HTML of a webpage
+        
+        Args:
+            url: URL to fetch
+            
+        Returns:
+            str: Response body or None if fetch fails
+        """
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        try:
+            response = self.session.get(url, timeout=REQUEST_TIMEOUT)
+            if response.status_code == 429 and self.rate_limiter is not None:
+                # Back off for as long as the server asks before sending more
+                self.rate_limiter.pause(_retry_after(response))
             response.raise_for_status()
-            return BeautifulSoup(response.text, "lxml")
+            return response.text
         except requests.RequestException as e:
             self.logger.error(f"Error fetching {url}: {str(e)}")
             return None
 
+    def _get_cached_detail(self, url: str) -> Optional[Any]:
+        """
+        Look up the cached detail result for a job URL
+        
+        Args:
+            url: Job detail page URL
+            
+        Returns:
+            Result stored with _cache_detail, or None if not cached
+        """
+        with self._detail_cache_lock:
+            if url in self._detail_cache:
+                self._detail_cache.move_to_end(url)
+                return self._detail_cache[url]
+        return None
+
+    def _cache_detail(self, url: str, result: Any) -> None:
+        """
+        Remember the detail result for a job URL, evicting the least recently used
+        
+        Only successful results should be cached, so failed fetches are retried.
+        
+        Args:
+            url: Job detail page URL
+            result: Extracted detail result
+        """
+        with self._detail_cache_lock:
+            self._detail_cache[url] = result
+            if len(self._detail_cache) > DETAIL_CACHE_SIZE:
+                self._detail_cache.popitem(last=False)
+
+    def _run_concurrently(self, func: Callable[[T], R], items: Iterable[T],
+                          max_workers: int = MAX_CONCURRENT_REQUESTS) -> List[R]:
+        """
+        Apply a blocking I/O function to items using a bounded thread pool
+        
+        Args:
+            func: Function to call for each item
+            items: Items to process
+            max_workers: Maximum number of items processed at once
+            
+        Returns:
+            List of results in the same order as items
+        """
+        items = list(items)
+        if len(items) <= 1 or max_workers <= 1:
+            return [func(item) for item in items]
+            
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+            return list(executor.map(func, items))
+
+    def _fetch_pages(self, urls: Iterable[str]) -> List[Optional[BeautifulSoup]]:
+        """
+        Fetch and parse several webpages concurrently
+        
+        Args:
+            urls: URLs to fetch
+            
+        Returns:
+            List of BeautifulSoup objects (or None for failed fetches) in the same order as urls
+        """
+        return self._run_concurrently(self._fetch_page, urls)
+
+    def close(self) -> None:
+        """Release the scraper's HTTP session"""
+        self.session.close()
+
+    async def aclose(self) -> None:
+        """Release the scraper's resources without blocking the event loop"""
+        await asyncio.to_thread(self.close)
+
+    def iter_jobs(self, keywords: List[str]) -> Iterator[JobPosting]:
+        """
+        Scrape job postings, yielding them as they become available
+        
+        The default implementation yields the result of scrape_jobs once it
+        completes; scrapers that can produce jobs incrementally override it.
+        
+        Args:
+            keywords: List of keywords to search for
+            
+        Yields:
+            JobPosting objects
+        """
+        yield from self.scrape_jobs(keywords)
+
     @abstractmethod
     def scrape_jobs(self, keywords: List[str]) -> List[JobPosting]:
         """
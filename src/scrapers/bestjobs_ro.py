@@ -1,50 +1,65 @@
 """
 Scraper for BestJobs.ro website
 """
-from typing import List, Optional
-from datetime import datetime, timedelta
+from typing import Iterator, List, Optional, Set
+from datetime import date, timedelta
 import re
 from urllib.parse import urljoin, quote
-from bs4 import BeautifulSoup
-from .base import BaseScraper, JobPosting
+from lxml.etree import XPath
+from .base import BaseScraper, JobPosting, element_text, has_class
+
+# Relative posting dates such as "acum 2 zile" ("2 days ago")
+_DAYS_RE = re.compile(r"acum\s+(\d+)\s+zile?")
 
 class BestJobsRoScraper(BaseScraper):
     """Scraper for BestJobs.ro website"""
     
+    # Selectors compiled once and reused for every card and detail page
+    _CARD_XP = XPath(f".//div[{has_class('job-card')}]")
+    _TITLE_XP = XPath(f"(.//h2[{has_class('title')}])[1]")
+    _TITLE_LINK_XP = XPath("(.//a[@href])[1]/@href")
+    _COMPANY_XP = XPath(f"(.//div[{has_class('company-name')}])[1]")
+    _LOCATION_XP = XPath(f"(.//div[{has_class('location')}])[1]")
+    _DATE_XP = XPath(f"(.//div[{has_class('posting-date')}])[1]")
+    _DESCRIPTION_XP = XPath(f"(.//div[{has_class('job-description')}])[1]")
+    
     def __init__(self):
         super().__init__("https://www.bestjobs.ro")
         
-    def _parse_date(self, date_str: str) -> Optional[str]:
+    def _parse_date(self, date_str: str, today: Optional[date] = None) -> Optional[str]:
         """
         Parse BestJobs.ro date format to ISO format
         
         Args:
             date_str: Date string from BestJobs (e.g., "Publicat azi", "Publicat acum 2 zile")
+            today: Reference date for relative dates, defaults to today
             
         Returns:
             ISO formatted date string or None if parsing fails
         """
-        try:
-            date_str = date_str.lower()
-            today = datetime.now()
+        date_str = date_str.lower()
+        if today is None:
+            today = date.today()
+        
+        if "azi" in date_str:
+            return today.isoformat()
             
-            if "azi" in date_str:
-                return today.strftime("%Y-%m-%d")
-                
-            if "ieri" in date_str:
-                return (today - timedelta(days=1)).strftime("%Y-%m-%d")
-                
-            # Match patterns like "acum 2 zile"
-            days_match = re.search(r"acum\s+(\d+)\s+zile?", date_str)
-            if days_match:
-                days = int(days_match.group(1))
-                return (today - timedelta(days=days)).strftime("%Y-%m-%d")
-                
-            return None
+        if "ieri" in date_str:
+            return (today - timedelta(days=1)).isoformat()
             
-        except Exception as e:
-            self.logger.error(f"Error parsing date {date_str}: {str(e)}")
+        # Match patterns like "acum 2 zile"
+        if "acum" not in date_str:
             return None
+        days_match = _DAYS_RE.search(date_str)
+        if days_match:
+            days = int(days_match.group(1))
+            try:
+                return (today - timedelta(days=days)).isoformat()
+            except OverflowError:
+                self.logger.error(f"Error parsing date {date_str}: out of range")
+                return None
+            
+        return None
 
     def _build_search_url(self, keyword: str, location: str = "") -> str:
         """
@@ -70,6 +85,67 @@ class BestJobsRoScraper(BaseScraper):
             
         return url
 
+    def _parse_card(self, card, today: Optional[date] = None) -> Optional[dict]:
+        """
+        Extract the listing fields from a job card
+        
+        Args:
+            card: lxml element of a job card
+            today: Reference date for relative posting dates, defaults to today
+            
+        Returns:
+            Dict with title, company, location, url and date, or None if the
+            card lacks a title, company or link
+        """
+        title_elem = self._TITLE_XP(card)
+        company_elem = self._COMPANY_XP(card)
+        location_elem = self._LOCATION_XP(card)
+        date_elem = self._DATE_XP(card)
+        
+        if not all([title_elem, company_elem]):
+            return None
+            
+        # Get job URL
+        title_link = self._TITLE_LINK_XP(title_elem[0])
+        if not title_link:
+            return None
+            
+        return {
+            "title": element_text(title_elem[0]),
+            "company": element_text(company_elem[0]),
+            "location": element_text(location_elem[0]) if location_elem else "Not specified",
+            "url": urljoin(self.base_url, title_link[0]),
+            "date": self._parse_date(element_text(date_elem[0]), today) if date_elem else None
+        }
+
+    def _fetch_description(self, url: str) -> str:
+        """
+        Fetch a job's detail page and extract its description
+        
+        Descriptions are cached by URL, so a job listed again under another
+        keyword or on a later scrape is not downloaded twice. Failed fetches
+        are not cached.
+        
+        Args:
+            url: Job detail page URL
+            
+        Returns:
+            str: Job description, or an empty string if unavailable
+        """
+        cached = self._get_cached_detail(url)
+        if cached is not None:
+            return cached
+            
+        job_tree = self._fetch_tree(url)
+        if job_tree is None:
+            return ""
+            
+        description_elem = self._DESCRIPTION_XP(job_tree)
+        description = element_text(description_elem[0]) if description_elem else ""
+        
+        self._cache_detail(url, description)
+        return description
+
     def scrape_jobs(self, keywords: List[str]) -> List[JobPosting]:
         """
         Scrape jobs from BestJobs.ro
@@ -80,7 +156,23 @@ class BestJobsRoScraper(BaseScraper):
         Returns:
             List of JobPosting objects
         """
-        jobs: List[JobPosting] = []
+        return list(self.iter_jobs(keywords))
+
+    def iter_jobs(self, keywords: List[str]) -> Iterator[JobPosting]:
+        """
+        Scrape jobs from BestJobs.ro, yielding each page's jobs as soon as
+        its detail pages have been fetched
+        
+        Args:
+            keywords: List of keywords to search for
+            
+        Yields:
+            JobPosting objects
+        """
+        # Jobs matching several keywords or repeated across pages are kept once
+        seen_urls: Set[str] = set()
+        # Read the clock once rather than for every card
+        today = date.today()
         
         for keyword in keywords:
             try:
@@ -92,58 +184,45 @@ class BestJobsRoScraper(BaseScraper):
                 while True:
                     # Add page parameter for pagination
                     page_url = f"{search_url}?page={page}"
-                    soup = self._fetch_page(page_url)
+                    tree = self._fetch_tree(page_url)
                     
-                    if not soup:
+                    if tree is None:
                         break
                         
                     # Find all job cards
-                    job_cards = soup.find_all("div", class_="job-card")
+                    job_cards = self._CARD_XP(tree)
                     
                     if not job_cards:
                         break
                         
+                    listings = []
                     for card in job_cards:
                         try:
-                            # Extract job details
-                            title_elem = card.find("h2", class_="title")
-                            company_elem = card.find("div", class_="company-name")
-                            location_elem = card.find("div", class_="location")
-                            date_elem = card.find("div", class_="posting-date")
-                            
-                            if not all([title_elem, company_elem]):
-                                continue
-                                
-                            # Get job URL
-                            title_link = title_elem.find("a", href=True)
-                            if not title_link:
-                                continue
-                                
-                            job_url = urljoin(self.base_url, title_link["href"])
-                            
-                            # Get detailed description
-                            job_soup = self._fetch_page(job_url)
-                            description = ""
-                            if job_soup:
-                                description_elem = job_soup.find("div", class_="job-description")
-                                if description_elem:
-                                    description = description_elem.get_text(strip=True)
-                            
-                            job = JobPosting(
-                                title=title_elem.get_text(strip=True),
-                                company=company_elem.get_text(strip=True),
-                                location=location_elem.get_text(strip=True) if location_elem else "Not specified",
-                                url=job_url,
-                                description=description,
-                                posted_date=self._parse_date(date_elem.get_text(strip=True)) if date_elem else None
-                            )
-                            
-                            jobs.append(job)
-                            
+                            listing = self._parse_card(card, today)
+                            if listing and listing["url"] not in seen_urls:
+                                seen_urls.add(listing["url"])
+                                if listing["url"] not in self.known_urls:
+                                    listings.append(listing)
                         except Exception as e:
                             self.logger.error(f"Error parsing job card: {str(e)}")
                             continue
                     
+                    # Fetch the detail pages of all cards on this page concurrently
+                    descriptions = self._run_concurrently(
+                        self._fetch_description,
+                        [listing["url"] for listing in listings]
+                    )
+                    
+                    for listing, description in zip(listings, descriptions):
+                        yield JobPosting(
+                            title=listing["title"],
+                            company=listing["company"],
+                            location=listing["location"],
+                            url=listing["url"],
+                            description=description,
+                            posted_date=listing["date"]
+                        )
+                    
                     # Move to next page
                     page += 1
                     
@@ -154,5 +233,3 @@ class BestJobsRoScraper(BaseScraper):
             except Exception as e:
                 self.logger.error(f"Error scraping BestJobs.ro for keyword {keyword}: {str(e)}")
                 continue
-                
-        return jobs 
\ No newline at end of file
@@ -1,12 +1,40 @@
 """
 Scraper for eJobs.ro website
 """
-from typing import List, Optional
-from datetime import datetime, timedelta
+from typing import List, Optional, Set
+from datetime import date, timedelta
 import re
 from urllib.parse import urljoin, quote
 from bs4 import BeautifulSoup
-from .base import BaseScraper, JobPosting
+from lxml.etree import XPath
+from .base import BaseScraper, JobPosting, class_strainer, element_text, has_class
+
+# Relative posting dates such as "acum 3 zile" or "3 zile în urmă"
+_DAYS_RE = re.compile(r"(?:acum\s+)?(\d+)\s+zile?(?:\s+[îi]n\s+urm[aă])?")
+
+class _SalaryCharTable(dict):
+    """
+    str.translate table keeping only digits, whitespace and hyphens
+    
+    Entries are filled in on first lookup, so any Unicode character (e.g. "€"
+    or "ă") is handled without building a table for the whole code space.
+    """
+    
+    def __missing__(self, code: int) -> Optional[int]:
+        char = chr(code)
+        kept = code if char.isdecimal() or char.isspace() or char == "-" else None
+        self[code] = kept
+        return kept
+
+# Strips currency symbols and words from salaries
+_SALARY_TABLE = _SalaryCharTable()
+
+# Only the job cards of a results page are parsed into a tree
+_LISTING_STRAINER = class_strainer("div", "JCContent")
+
+# Detail pages are parsed with lxml directly, which is several times faster
+# than building a BeautifulSoup tree for the one element that is read
+_DESCRIPTION_XP = XPath(f"(//div[{has_class('JDDescription')}])[1]")
 
 class EJobsRoScraper(BaseScraper):
     """Scraper for eJobs.ro website"""
@@ -22,37 +50,38 @@ class EJobsRoScraper(BaseScraper):
             "Upgrade-Insecure-Requests": "1",
         })
 
-    def _parse_date(self, date_str: str) -> Optional[str]:
+    def _parse_date(self, date_str: str, today: Optional[date] = None) -> Optional[str]:
         """
         Parse eJobs.ro date format to ISO format
         
         Args:
             date_str: Date string from eJobs (e.g., "Actualizat azi", "Publicat acum 3 zile")
+            today: Reference date for relative dates, defaults to today
             
         Returns:
             ISO formatted date string or None if parsing fails
         """
-        try:
-            date_str = date_str.lower().strip()
-            today = datetime.now()
+        date_str = date_str.lower().strip()
+        if today is None:
+            today = date.today()
+        
+        if "azi" in date_str:
+            return today.isoformat()
             
-            if "azi" in date_str:
-                return today.strftime("%Y-%m-%d")
-                
-            if "ieri" in date_str:
-                return (today - timedelta(days=1)).strftime("%Y-%m-%d")
-                
-            # Match patterns like "acum 3 zile" or "3 zile în urmă"
-            days_match = re.search(r"(?:acum\s+)?(\d+)\s+zile?(?:\s+[îi]n\s+urm[aă])?", date_str)
-            if days_match:
-                days = int(days_match.group(1))
-                return (today - timedelta(days=days)).strftime("%Y-%m-%d")
-                
-            return None
+        if "ieri" in date_str:
+            return (today - timedelta(days=1)).isoformat()
             
-        except Exception as e:
-            self.logger.error(f"Error parsing date {date_str}: {str(e)}")
-            return None
+        # Match patterns like "acum 3 zile" or "3 zile în urmă"
+        days_match = _DAYS_RE.search(date_str)
+        if days_match:
+            days = int(days_match.group(1))
+            try:
+                return (today - timedelta(days=days)).isoformat()
+            except OverflowError:
+                self.logger.error(f"Error parsing date {date_str}: out of range")
+                return None
+            
+        return None
 
     def _parse_salary(self, salary_elem) -> Optional[str]:
         """
@@ -69,9 +98,8 @@ class EJobsRoScraper(BaseScraper):
             
         try:
             salary_text = salary_elem.get_text(strip=True)
-            # Remove currency symbols and normalize format
-            salary_text = re.sub(r'[^\d\s-]+', '', salary_text)
-            salary_text = re.sub(r'\s+', ' ', salary_text).strip()
+            # Remove currency symbols and collapse runs of whitespace
+            salary_text = " ".join(salary_text.translate(_SALARY_TABLE).split())
             return salary_text if salary_text else None
         except Exception as e:
             self.logger.error(f"Error parsing salary: {str(e)}")
@@ -101,6 +129,68 @@ class EJobsRoScraper(BaseScraper):
             
         return url
 
+    def _parse_card(self, card, today: Optional[date] = None) -> Optional[dict]:
+        """
+        Extract the listing fields from a job card
+        
+        Args:
+            card: BeautifulSoup element of a job card
+            today: Reference date for relative posting dates, defaults to today
+            
+        Returns:
+            Dict with title, company, location, url, date and salary, or None
+            if the card lacks a title, company or link
+        """
+        title_elem = card.find("h2", class_="JCTitle")
+        company_elem = card.find("span", class_="JCCompany")
+        location_elem = card.find("span", class_="JCLocation")
+        date_elem = card.find("span", class_="JCDate")
+        salary_elem = card.find("span", class_="JCSalary")
+        
+        if not all([title_elem, company_elem]):
+            return None
+            
+        # Get job URL
+        title_link = title_elem.find("a", href=True)
+        if not title_link:
+            return None
+            
+        return {
+            "title": title_elem.get_text(strip=True),
+            "company": company_elem.get_text(strip=True),
+            "location": location_elem.get_text(strip=True) if location_elem else "Not specified",
+            "url": urljoin(self.base_url, title_link["href"]),
+            "date": self._parse_date(date_elem.get_text(strip=True), today) if date_elem else None,
+            "salary": self._parse_salary(salary_elem)
+        }
+
+    def _fetch_description(self, url: str) -> str:
+        """
+        Fetch a job's detail page and extract its description
+        
+        Descriptions are cached by URL, so a job listed again under another
+        keyword is not downloaded twice. Failed fetches are not cached.
+        
+        Args:
+            url: Job detail page URL
+            
+        Returns:
+            str: Job description, or an empty string if unavailable
+        """
+        cached = self._get_cached_detail(url)
+        if cached is not None:
+            return cached
+            
+        job_tree = self._fetch_tree(url)
+        if job_tree is None:
+            return ""
+            
+        description_elem = _DESCRIPTION_XP(job_tree)
+        description = element_text(description_elem[0]) if description_elem else ""
+        
+        self._cache_detail(url, description)
+        return description
+
     def scrape_jobs(self, keywords: List[str]) -> List[JobPosting]:
         """
         Scrape jobs from eJobs.ro
@@ -112,6 +202,10 @@ class EJobsRoScraper(BaseScraper):
             List of JobPosting objects
         """
         jobs: List[JobPosting] = []
+        # Postings found by several keywords are fetched and returned once
+        seen_urls: Set[str] = set()
+        # Resolve relative posting dates against one reference date per run
+        today = date.today()
         
         for keyword in keywords:
             try:
@@ -122,7 +216,7 @@ class EJobsRoScraper(BaseScraper):
                 while True:
                     # Add page parameter for pagination
                     page_url = f"{search_url}/page{page}" if page > 1 else search_url
-                    soup = self._fetch_page(page_url)
+                    soup = self._fetch_page(page_url, _LISTING_STRAINER)
                     
                     if not soup:
                         break
@@ -133,53 +227,37 @@ class EJobsRoScraper(BaseScraper):
                     if not job_cards:
                         break
                         
+                    listings = []
                     for card in job_cards:
                         try:
-                            # Extract job details
-                            title_elem = card.find("h2", class_="JCTitle")
-                            company_elem = card.find("span", class_="JCCompany")
-                            location_elem = card.find("span", class_="JCLocation")
-                            date_elem = card.find("span", class_="JCDate")
-                            salary_elem = card.find("span", class_="JCSalary")
-                            
-                            if not all([title_elem, company_elem]):
-                                continue
-                                
-                            # Get job URL
-                            title_link = title_elem.find("a", href=True)
-                            if not title_link:
-                                continue
-                                
-                            job_url = urljoin(self.base_url, title_link["href"])
-                            
-                            # Get detailed description
-                            job_soup = self._fetch_page(job_url)
-                            description = ""
-                            if job_soup:
-                                description_elem = job_soup.find("div", class_="JDDescription")
-                                if description_elem:
-                                    description = description_elem.get_text(strip=True)
-                            
-                            # Parse salary if available
-                            salary = self._parse_salary(salary_elem)
-                            if salary:
-                                description = f"Salary: {salary}\n\n{description}"
-                            
-                            job = JobPosting(
-                                title=title_elem.get_text(strip=True),
-                                company=company_elem.get_text(strip=True),
-                                location=location_elem.get_text(strip=True) if location_elem else "Not specified",
-                                url=job_url,
-                                description=description,
-                                posted_date=self._parse_date(date_elem.get_text(strip=True)) if date_elem else None
-                            )
-                            
-                            jobs.append(job)
-                            
+                            listing = self._parse_card(card, today)
+                            if listing and listing["url"] not in seen_urls:
+                                seen_urls.add(listing["url"])
+                                if listing["url"] not in self.known_urls:
+                                    listings.append(listing)
                         except Exception as e:
                             self.logger.error(f"Error parsing job card: {str(e)}")
                             continue
                     
+                    # Fetch the detail pages of all cards on this page concurrently
+                    descriptions = self._run_concurrently(
+                        self._fetch_description,
+                        [listing["url"] for listing in listings]
+                    )
+                    
+                    for listing, description in zip(listings, descriptions):
+                        if listing["salary"]:
+                            description = f"Salary: {listing['salary']}\n\n{description}"
+                            
+                        jobs.append(JobPosting(
+                            title=listing["title"],
+                            company=listing["company"],
+                            location=listing["location"],
+                            url=listing["url"],
+                            description=description,
+                            posted_date=listing["date"]
+                        ))
+                    
                     # Move to next page
                     page += 1
                     
@@ -191,4 +269,4 @@ class EJobsRoScraper(BaseScraper):
                 self.logger.error(f"Error scraping eJobs.ro for keyword {keyword}: {str(e)}")
                 continue
                 
-        return jobs
\ No newline at end of file
+        return jobs
@@ -1,12 +1,26 @@
 """
 Scraper for Hipo.ro website, focusing on student and entry-level positions
 """
-from typing import List, Optional, Dict
-from datetime import datetime, timedelta
+from typing import List, Optional, Dict, Set
+from datetime import date, timedelta
 import re
 from urllib.parse import urljoin, quote
 from bs4 import BeautifulSoup
-from .base import BaseScraper, JobPosting
+from lxml.etree import XPath
+from .base import BaseScraper, JobPosting, class_strainer, element_text, has_class
+
+# Relative posting dates such as "acum 2 zile" ("2 days ago")
+_DAYS_RE = re.compile(r"acum\s+(\d+)\s+zile?")
+
+# Only the job cards of a results page are parsed into a tree
+_LISTING_STRAINER = class_strainer("div", "job-card")
+
+# Sections read from a job's detail page, which is parsed with lxml directly
+_DETAIL_SECTION_XPS = {
+    "description": XPath(f"(//div[{has_class('job-description')}])[1]"),
+    "requirements": XPath(f"(//div[{has_class('job-requirements')}])[1]"),
+    "benefits": XPath(f"(//div[{has_class('job-benefits')}])[1]"),
+}
 
 class HipoRoScraper(BaseScraper):
     """Scraper for Hipo.ro website"""
@@ -29,37 +43,38 @@ class HipoRoScraper(BaseScraper):
             "Cache-Control": "no-cache"
         })
 
-    def _parse_date(self, date_str: str) -> Optional[str]:
+    def _parse_date(self, date_str: str, today: Optional[date] = None) -> Optional[str]:
         """
         Parse Hipo.ro date format to ISO format
         
         Args:
             date_str: Date string from Hipo.ro (e.g., "Adăugat astăzi", "Acum 2 zile")
+            today: Reference date for relative dates, defaults to today
             
         Returns:
             ISO formatted date string or None if parsing fails
         """
-        try:
-            date_str = date_str.lower().strip()
-            today = datetime.now()
+        date_str = date_str.lower().strip()
+        if today is None:
+            today = date.today()
+        
+        if "astăzi" in date_str or "azi" in date_str:
+            return today.isoformat()
             
-            if "astăzi" in date_str or "azi" in date_str:
-                return today.strftime("%Y-%m-%d")
-                
-            if "ieri" in date_str:
-                return (today - timedelta(days=1)).strftime("%Y-%m-%d")
-                
-            # Match patterns like "Acum 2 zile"
-            days_match = re.search(r"acum\s+(\d+)\s+zile?", date_str)
-            if days_match:
-                days = int(days_match.group(1))
-                return (today - timedelta(days=days)).strftime("%Y-%m-%d")
-                
-            return None
+        if "ieri" in date_str:
+            return (today - timedelta(days=1)).isoformat()
             
-        except Exception as e:
-            self.logger.error(f"Error parsing date {date_str}: {str(e)}")
-            return None
+        # Match patterns like "Acum 2 zile"
+        days_match = _DAYS_RE.search(date_str)
+        if days_match:
+            days = int(days_match.group(1))
+            try:
+                return (today - timedelta(days=days)).isoformat()
+            except OverflowError:
+                self.logger.error(f"Error parsing date {date_str}: out of range")
+                return None
+            
+        return None
 
     def _detect_job_type(self, title: str, description: str) -> str:
         """
@@ -120,43 +135,76 @@ class HipoRoScraper(BaseScraper):
         """
         Extract detailed job information from job page
         
+        Details are cached by URL, so a job listed again under another
+        keyword is not downloaded twice. Failed fetches are not cached.
+        
         Args:
             job_url: URL of the job posting
             
         Returns:
             Dict containing job details
         """
+        cached = self._get_cached_detail(job_url)
+        if cached is not None:
+            return cached
+            
         details = {
             "description": "",
             "requirements": "",
             "benefits": ""
         }
         
-        soup = self._fetch_page(job_url)
-        if not soup:
+        tree = self._fetch_tree(job_url)
+        if tree is None:
             return details
             
         try:
-            # Find job description
-            desc_elem = soup.find("div", class_="job-description")
-            if desc_elem:
-                details["description"] = desc_elem.get_text(strip=True)
+            # Find the description, requirements and benefits sections
+            for key, section_xp in _DETAIL_SECTION_XPS.items():
+                section = section_xp(tree)
+                if section:
+                    details[key] = element_text(section[0])
                 
-            # Find requirements
-            req_elem = soup.find("div", class_="job-requirements")
-            if req_elem:
-                details["requirements"] = req_elem.get_text(strip=True)
-                
-            # Find benefits
-            benefits_elem = soup.find("div", class_="job-benefits")
-            if benefits_elem:
-                details["benefits"] = benefits_elem.get_text(strip=True)
+            self._cache_detail(job_url, details)
                 
         except Exception as e:
             self.logger.error(f"Error extracting job details from {job_url}: {str(e)}")
             
         return details
 
+    def _parse_card(self, card, today: Optional[date] = None) -> Optional[dict]:
+        """
+        Extract the listing fields from a job card
+        
+        Args:
+            card: BeautifulSoup element of a job card
+            today: Reference date for relative posting dates, defaults to today
+            
+        Returns:
+            Dict with title, company, location, url and date, or None if the
+            card lacks a title, company or link
+        """
+        title_elem = card.find("h2", class_="job-title")
+        company_elem = card.find("div", class_="company-name")
+        location_elem = card.find("div", class_="job-location")
+        date_elem = card.find("div", class_="post-date")
+        
+        if not all([title_elem, company_elem]):
+            return None
+            
+        # Get job URL
+        title_link = title_elem.find("a", href=True)
+        if not title_link:
+            return None
+            
+        return {
+            "title": title_elem.get_text(strip=True),
+            "company": company_elem.get_text(strip=True),
+            "location": location_elem.get_text(strip=True) if location_elem else "Not specified",
+            "url": urljoin(self.base_url, title_link["href"]),
+            "date": self._parse_date(date_elem.get_text(strip=True), today) if date_elem else None
+        }
+
     def scrape_jobs(self, keywords: List[str]) -> List[JobPosting]:
         """
         Scrape jobs from Hipo.ro
@@ -168,6 +216,10 @@ class HipoRoScraper(BaseScraper):
             List of JobPosting objects
         """
         jobs: List[JobPosting] = []
+        # Postings found by several keywords are fetched and returned once
+        seen_urls: Set[str] = set()
+        # Use the same reference date for every card scraped in this run
+        today = date.today()
         
         for keyword in keywords:
             try:
@@ -176,7 +228,7 @@ class HipoRoScraper(BaseScraper):
                 
                 while True:
                     search_url = self._build_search_url(keyword, page=page)
-                    soup = self._fetch_page(search_url)
+                    soup = self._fetch_page(search_url, _LISTING_STRAINER)
                     
                     if not soup:
                         break
@@ -187,46 +239,50 @@ class HipoRoScraper(BaseScraper):
                     if not job_cards:
                         break
                         
+                    listings = []
                     for card in job_cards:
                         try:
-                            # Extract job details
-                            title_elem = card.find("h2", class_="job-title")
-                            company_elem = card.find("div", class_="company-name")
-                            location_elem = card.find("div", class_="job-location")
-                            date_elem = card.find("div", class_="post-date")
-                            
-                            if not all([title_elem, company_elem]):
-                                continue
-                                
-                            # Get job URL
-                            title_link = title_elem.find("a", href=True)
-                            if title_link:
-                                job_url = urljoin(self.base_url, title_link["href"])
-                                
-                                # Extract job details
-                                details = self._extract_job_details(job_url)
-                                
-                                # Create JobPosting object
-                                job = JobPosting(
-                                    title=title_elem.get_text(strip=True),
-                                    company=company_elem.get_text(strip=True),
-                                    location=location_elem.get_text(strip=True),
-                                    date=self._parse_date(date_elem.get_text(strip=True)),
-                                    description=details["description"],
-                                    requirements=details["requirements"],
-                                    benefits=details["benefits"]
-                                )
-                                
-                                jobs.append(job)
+                            listing = self._parse_card(card, today)
+                            if listing and listing["url"] not in seen_urls:
+                                seen_urls.add(listing["url"])
+                                if listing["url"] not in self.known_urls:
+                                    listings.append(listing)
                                 
                         except Exception as e:
-                            self.logger.error(f"Error scraping job from {job_url}: {str(e)}")
+                            self.logger.error(f"Error parsing job card: {str(e)}")
                             
-                        break
+                    # Fetch the detail pages of all cards on this page concurrently
+                    all_details = self._run_concurrently(
+                        self._extract_job_details,
+                        [listing["url"] for listing in listings]
+                    )
+                    
+                    for listing, details in zip(listings, all_details):
+                        # JobPosting has a single free-text field for the details
+                        description = "\n\n".join(
+                            text for text in (
+                                details["description"],
+                                details["requirements"],
+                                details["benefits"]
+                            ) if text
+                        )
+                        
+                        jobs.append(JobPosting(
+                            title=listing["title"],
+                            company=listing["company"],
+                            location=listing["location"],
+                            url=listing["url"],
+                            description=description,
+                            posted_date=listing["date"]
+                        ))
                         
                     page += 1
                     
+                    # Break if we've processed too many pages (avoid infinite loops)
+                    if page > 10:
+                        break
+                    
             except Exception as e:
                 self.logger.error(f"Error scraping Hipo.ro for keyword: {keyword}: {str(e)}")
                 
-        return jobs 
\ No newline at end of file
+        return jobs
@@ -1,94 +1,84 @@
 """
 LinkedIn Jobs scraper implementation with rate limiting and ethical practices
 """
-from typing import List, Optional, Dict
-from datetime import datetime, timedelta
+from typing import List, Optional, Set
+from datetime import date, timedelta
 import re
 import time
 import random
 from urllib.parse import quote
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from .base import BaseScraper, JobPosting
+from src.utils.rate_limit import RateLimiter
+from .base import BaseScraper, JobPosting, class_strainer
+
+# Relative posting dates such as "2 days ago", and each unit's length in days
+_AGO_RE = re.compile(r"(\d+)\s+(day|week|month|hour|minute)s?\s+ago")
+_AGO_UNIT_DAYS = {
+    "day": 1,
+    "week": 7,
+    "month": 30,
+    "hour": 1/24,
+    "minute": 1/1440
+}
+
+# LinkedIn's guest job endpoints, which serve plain HTML fragments without
+# requiring JavaScript or a login
+SEARCH_API_URL = "https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search"
+JOB_API_URL = "https://www.linkedin.com/jobs-guest/jobs/api/jobPosting"
+
+# Number of results LinkedIn returns per search page
+RESULTS_PER_PAGE = 25
+
+# Maximum number of result pages fetched per keyword
+MAX_PAGES = 4
+
+# LinkedIn's guest endpoints answer 429 quickly under load, so requests are
+# paced and only a couple of descriptions are fetched at a time
+REQUESTS_PER_SECOND = 2
+MAX_CONCURRENT_DESCRIPTIONS = 2
+
+# Only the parts of each response the scraper reads are parsed into a tree
+_CARD_STRAINER = class_strainer("div", "base-card")
+_DESCRIPTION_STRAINER = class_strainer("div", "show-more-less-html__markup")
 
 class LinkedInScraper(BaseScraper):
     """Scraper for LinkedIn Jobs with ethical rate limiting"""
     
     def __init__(self):
         super().__init__("https://www.linkedin.com/jobs")
-        self.driver = None
-        self._setup_driver()
-        
-    def _setup_driver(self) -> None:
-        """Initialize Selenium WebDriver with appropriate options"""
-        options = webdriver.ChromeOptions()
-        options.add_argument("--headless")  # Run in headless mode
-        options.add_argument("--disable-gpu")
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-        options.add_argument("--window-size=1920,1080")
-        
-        # Add random user agent
-        user_agents = [
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/92.0.4515.107 Safari/537.36",
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-        ]
-        options.add_argument(f"user-agent={random.choice(user_agents)}")
-        
-        self.driver = webdriver.Chrome(options=options)
-        self.driver.implicitly_wait(10)
-        
-    def __del__(self):
-        """Clean up WebDriver on object destruction"""
-        if self.driver:
-            self.driver.quit()
+        self.rate_limiter = RateLimiter(REQUESTS_PER_SECOND)
 
-    def _parse_date(self, date_str: str) -> Optional[str]:
+    def _parse_date(self, date_str: str, today: Optional[date] = None) -> Optional[str]:
         """
         Parse LinkedIn date format to ISO format
         
         Args:
             date_str: Date string from LinkedIn (e.g., "2 days ago", "1 week ago")
+            today: Reference date for relative dates, defaults to today
             
         Returns:
             ISO formatted date string or None if parsing fails
         """
-        try:
-            date_str = date_str.lower().strip()
-            today = datetime.now()
+        date_str = date_str.lower().strip()
+        if today is None:
+            today = date.today()
+        
+        if "just now" in date_str or "today" in date_str:
+            return today.isoformat()
             
-            if "just now" in date_str or "today" in date_str:
-                return today.strftime("%Y-%m-%d")
-                
-            if "yesterday" in date_str:
-                return (today - timedelta(days=1)).strftime("%Y-%m-%d")
-                
-            # Match patterns like "2 days ago", "1 week ago", "3 months ago"
-            time_map = {
-                "day": 1,
-                "week": 7,
-                "month": 30,
-                "hour": 1/24,
-                "minute": 1/1440
-            }
+        if "yesterday" in date_str:
+            return (today - timedelta(days=1)).isoformat()
             
-            for period, multiplier in time_map.items():
-                pattern = rf"(\d+)\s+{period}s?\s+ago"
-                match = re.search(pattern, date_str)
-                if match:
-                    value = int(match.group(1))
-                    days = value * multiplier
-                    return (today - timedelta(days=days)).strftime("%Y-%m-%d")
-                    
-            return None
+        # Match patterns like "2 days ago", "1 week ago", "3 months ago"
+        match = _AGO_RE.search(date_str)
+        if match:
+            days = int(match.group(1)) * _AGO_UNIT_DAYS[match.group(2)]
+            try:
+                return (today - timedelta(days=days)).isoformat()
+            except OverflowError:
+                self.logger.error(f"Error parsing date {date_str}: out of range")
+                return None
             
-        except Exception as e:
-            self.logger.error(f"Error parsing date {date_str}: {str(e)}")
-            return None
+        return None
 
     def _wait_random(self, min_seconds: float = 2.0, max_seconds: float = 5.0) -> None:
         """
@@ -100,13 +90,14 @@ class LinkedInScraper(BaseScraper):
         """
         time.sleep(random.uniform(min_seconds, max_seconds))
 
-    def _build_search_url(self, keyword: str, location: str = "") -> str:
+    def _build_search_url(self, keyword: str, location: str = "", start: int = 0) -> str:
         """
-        Build LinkedIn Jobs search URL
+        Build LinkedIn guest job search URL
         
         Args:
             keyword: Job title or keyword
             location: Location to search in
+            start: Offset of the first result to return
             
         Returns:
             str: Formatted search URL
@@ -115,68 +106,83 @@ class LinkedInScraper(BaseScraper):
         keyword_encoded = quote(keyword)
         location_encoded = quote(location) if location else ""
         
-        url = f"{self.base_url}/search?keywords={keyword_encoded}"
+        url = f"{SEARCH_API_URL}?keywords={keyword_encoded}&start={start}"
         if location_encoded:
             url = f"{url}&location={location_encoded}"
             
         return url
 
-    def _extract_job_details(self, job_card) -> Optional[Dict[str, str]]:
+    def _parse_card(self, card, today: Optional[date] = None) -> Optional[dict]:
         """
-        Extract job details from a job card element
+        Extract the listing fields from a search result card
         
         Args:
-            job_card: Selenium WebElement representing a job card
+            card: BeautifulSoup element of a job card
+            today: Reference date for relative posting dates, defaults to today
             
         Returns:
-            Dictionary containing job details or None if extraction fails
+            Dict with title, company, location, url, date and job ID, or None
+            if the card lacks a title, company or link
         """
-        try:
-            # Extract basic information with explicit waits
-            wait = WebDriverWait(self.driver, 10)
-            
-            title = wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "h3.job-title"))
-            ).text.strip()
-            
-            company = wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "h4.company-name"))
-            ).text.strip()
+        title_elem = card.select_one("h3.base-search-card__title")
+        company_elem = card.select_one("h4.base-search-card__subtitle")
+        location_elem = card.select_one("span.job-search-card__location")
+        date_elem = card.select_one("time")
+        link_elem = card.select_one("a.base-card__full-link[href]")
+        
+        if not all([title_elem, company_elem, link_elem]):
+            return None
             
-            location = wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "span.job-location"))
-            ).text.strip()
+        # The card's URN ends with the numeric job ID, e.g. urn:li:jobPosting:123
+        job_id = card.get("data-entity-urn", "").rpartition(":")[2]
+        
+        # Prefer the machine-readable date over the "2 days ago" text
+        posted_date = None
+        if date_elem:
+            posted_date = date_elem.get("datetime") or self._parse_date(date_elem.get_text(strip=True), today)
             
-            date_posted = wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "time.job-posted-date"))
-            ).text.strip()
+        return {
+            "title": title_elem.get_text(strip=True),
+            "company": company_elem.get_text(strip=True),
+            "location": location_elem.get_text(strip=True) if location_elem else "Not specified",
+            # Drop tracking parameters so the same job always has the same URL
+            "url": link_elem["href"].split("?", 1)[0],
+            "date": posted_date,
+            "job_id": job_id
+        }
+
+    def _fetch_description(self, job_id: str) -> str:
+        """
+        Fetch a job's description from the guest job posting endpoint
+        
+        Results are cached by job ID for the lifetime of the scraper, so later
+        runs do not download the same posting again. Failed fetches are not
+        cached.
+        
+        Args:
+            job_id: Numeric LinkedIn job ID
             
-            job_link = job_card.find_element(By.CSS_SELECTOR, "a.job-link").get_attribute("href")
+        Returns:
+            str: Job description, or an empty string if unavailable
+        """
+        if not job_id:
+            return ""
             
-            # Click to expand job description
-            try:
-                show_more = job_card.find_element(By.CSS_SELECTOR, "button.show-more-less-button")
-                show_more.click()
-                self._wait_random(1.0, 2.0)
-            except NoSuchElementException:
-                pass
-                
-            description = wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "div.job-description"))
-            ).text.strip()
+        job_url = f"{JOB_API_URL}/{job_id}"
+        cached = self._get_cached_detail(job_url)
+        if cached is not None:
+            return cached
             
-            return {
-                "title": title,
-                "company": company,
-                "location": location,
-                "date_posted": date_posted,
-                "url": job_link,
-                "description": description
-            }
+        soup = self._fetch_page(job_url, _DESCRIPTION_STRAINER)
+        if soup is None:
+            return ""
             
-        except (TimeoutException, NoSuchElementException) as e:
-            self.logger.error(f"Error extracting job details: {str(e)}")
-            return None
+        description = ""
+        description_elem = soup.find("div", class_="show-more-less-html__markup")
+        if description_elem:
+            description = description_elem.get_text(" ", strip=True)
+        self._cache_detail(job_url, description)
+        return description
 
     def scrape_jobs(self, keywords: List[str]) -> List[JobPosting]:
         """
@@ -189,52 +195,66 @@ class LinkedInScraper(BaseScraper):
             List of JobPosting objects
         """
         jobs: List[JobPosting] = []
+        # Jobs matching several keywords or repeated across pages are kept once
+        seen_urls: Set[str] = set()
+        # Relative dates ("2 days ago") are resolved against a single date per run
+        today = date.today()
         
         for keyword in keywords:
             try:
                 self.logger.info(f"Scraping LinkedIn Jobs for keyword: {keyword}")
-                search_url = self._build_search_url(keyword)
-                
-                # Navigate to search URL
-                self.driver.get(search_url)
-                self._wait_random()
                 
-                # Scroll through results (LinkedIn loads jobs dynamically)
-                for _ in range(3):  # Limit to 3 scrolls for ethical scraping
-                    self.driver.execute_script(
-                        "window.scrollTo(0, document.body.scrollHeight);"
-                    )
-                    self._wait_random(1.0, 2.0)
+                for page in range(MAX_PAGES):
+                    # Ethical rate limiting between result pages
+                    if page:
+                        self._wait_random(1.0, 2.0)
+                        
+                    search_url = self._build_search_url(keyword, start=page * RESULTS_PER_PAGE)
+                    soup = self._fetch_page(search_url, _CARD_STRAINER)
                     
-                # Find all job cards
-                job_cards = self.driver.find_elements(By.CSS_SELECTOR, "div.job-card-container")
-                
-                for card in job_cards:
-                    try:
-                        details = self._extract_job_details(card)
-                        if not details:
-                            continue
-                            
-                        job = JobPosting(
-                            title=details["title"],
-                            company=details["company"],
-                            location=details["location"],
-                            url=details["url"],
-                            description=details["description"],
-                            posted_date=self._parse_date(details["date_posted"])
-                        )
+                    if not soup:
+                        break
                         
-                        jobs.append(job)
+                    job_cards = soup.find_all("div", class_="base-card")
+                    
+                    if not job_cards:
+                        break
                         
-                        # Ethical rate limiting
-                        self._wait_random()
+                    listings = []
+                    for card in job_cards:
+                        try:
+                            listing = self._parse_card(card, today)
+                            if listing and listing["url"] not in seen_urls:
+                                seen_urls.add(listing["url"])
+                                if listing["url"] not in self.known_urls:
+                                    listings.append(listing)
+                        except Exception as e:
+                            self.logger.error(f"Error processing job card: {str(e)}")
+                            continue
+                            
+                    # Fetch the descriptions of all cards on this page concurrently
+                    descriptions = self._run_concurrently(
+                        self._fetch_description,
+                        [listing["job_id"] for listing in listings],
+                        MAX_CONCURRENT_DESCRIPTIONS
+                    )
+                    
+                    for listing, description in zip(listings, descriptions):
+                        jobs.append(JobPosting(
+                            title=listing["title"],
+                            company=listing["company"],
+                            location=listing["location"],
+                            url=listing["url"],
+                            description=description,
+                            posted_date=listing["date"]
+                        ))
                         
-                    except Exception as e:
-                        self.logger.error(f"Error processing job card: {str(e)}")
-                        continue
+                    # A short page means there are no further results
+                    if len(job_cards) < RESULTS_PER_PAGE:
+                        break
                         
             except Exception as e:
                 self.logger.error(f"Error scraping LinkedIn for keyword {keyword}: {str(e)}")
                 continue
                 
-        return jobs
\ No newline at end of file
+        return jobs
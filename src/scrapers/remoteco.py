@@ -1,12 +1,73 @@
 """
 Remote.co job board scraper implementation
 """
-from typing import List, Optional, Dict
-from datetime import datetime, timedelta
+from typing import List, Optional, Dict, Tuple
+from datetime import date, timedelta
+from functools import lru_cache
 import re
 from urllib.parse import urljoin, quote
-from bs4 import BeautifulSoup
-from .base import BaseScraper, JobPosting
+from lxml.etree import XPath
+from .base import BaseScraper, JobPosting, element_text, has_class
+
+# Relative posting dates such as "Posted 2 days ago" or "Posted 3 weeks ago"
+_DAYS_RE = re.compile(r"(\d+)\s+days?\s+ago")
+_WEEKS_RE = re.compile(r"(\d+)\s+weeks?\s+ago")
+
+# Number of categories scraped at once. Each category also fetches its detail
+# pages concurrently, so this keeps the total within the shared connection pool.
+MAX_CONCURRENT_CATEGORIES = 2
+
+# Job cards on a category page and the listing fields inside each card
+_CARD_XP = XPath(f"//div[{has_class('job_listing')}]")
+_TITLE_XP = XPath(f"(.//h2[{has_class('job_title')}])[1]")
+_TITLE_LINK_XP = XPath("(.//a[@href])[1]/@href")
+_COMPANY_XP = XPath(f"(.//span[{has_class('company_name')}])[1]")
+_DATE_XP = XPath(f"(.//span[{has_class('job_date')}])[1]")
+
+# Fields read from a job's detail page, which is parsed with lxml directly
+_DETAIL_FIELD_XPS = {
+    "description": XPath(f"(//div[{has_class('job_description')}])[1]"),
+    "requirements": XPath(f"(//div[{has_class('job_requirements')}])[1]"),
+    "category": XPath(f"(//span[{has_class('job_category')}])[1]"),
+}
+
+@lru_cache(maxsize=512)
+def _parse_relative_date(date_str: str, today: date) -> Optional[str]:
+    """
+    Resolve a lowercased Remote.co date string against a reference date
+    
+    Posting dates repeat across cards ("2 days ago", "today"), so results
+    are memoized per string and reference date.
+    
+    Args:
+        date_str: Lowercased, stripped date string
+        today: Reference date for relative dates
+        
+    Returns:
+        ISO formatted date string or None if the format is not recognized
+        
+    Raises:
+        OverflowError: If the resolved date is out of range
+    """
+    if "today" in date_str:
+        return today.isoformat()
+        
+    if "yesterday" in date_str:
+        return (today - timedelta(days=1)).isoformat()
+        
+    # Match patterns like "Posted 2 days ago"
+    days_match = _DAYS_RE.search(date_str)
+    if days_match:
+        days = int(days_match.group(1))
+        return (today - timedelta(days=days)).isoformat()
+        
+    # Match patterns like "Posted 3 weeks ago"
+    weeks_match = _WEEKS_RE.search(date_str)
+    if weeks_match:
+        weeks = int(weeks_match.group(1))
+        return (today - timedelta(weeks=weeks)).isoformat()
+        
+    return None
 
 class RemoteCoScraper(BaseScraper):
     """Scraper for Remote.co website"""
@@ -36,42 +97,23 @@ class RemoteCoScraper(BaseScraper):
             "Upgrade-Insecure-Requests": "1"
         })
 
-    def _parse_date(self, date_str: str) -> Optional[str]:
+    def _parse_date(self, date_str: str, today: Optional[date] = None) -> Optional[str]:
         """
         Parse Remote.co date format to ISO format
         
         Args:
             date_str: Date string from Remote.co (e.g., "Posted 2 days ago")
+            today: Reference date for relative dates, defaults to today
             
         Returns:
             ISO formatted date string or None if parsing fails
         """
+        if today is None:
+            today = date.today()
         try:
-            date_str = date_str.lower().strip()
-            today = datetime.now()
-            
-            if "today" in date_str:
-                return today.strftime("%Y-%m-%d")
-                
-            if "yesterday" in date_str:
-                return (today - timedelta(days=1)).strftime("%Y-%m-%d")
-                
-            # Match patterns like "Posted 2 days ago"
-            days_match = re.search(r"(\d+)\s+days?\s+ago", date_str)
-            if days_match:
-                days = int(days_match.group(1))
-                return (today - timedelta(days=days)).strftime("%Y-%m-%d")
-                
-            # Match patterns like "Posted 3 weeks ago"
-            weeks_match = re.search(r"(\d+)\s+weeks?\s+ago", date_str)
-            if weeks_match:
-                weeks = int(weeks_match.group(1))
-                return (today - timedelta(weeks=weeks)).strftime("%Y-%m-%d")
-                
-            return None
-            
-        except Exception as e:
-            self.logger.error(f"Error parsing date {date_str}: {str(e)}")
+            return _parse_relative_date(date_str.lower().strip(), today)
+        except OverflowError:
+            self.logger.error(f"Error parsing date {date_str}: out of range")
             return None
 
     def _get_category_url(self, category: str) -> str:
@@ -90,43 +132,73 @@ class RemoteCoScraper(BaseScraper):
         """
         Extract detailed job information from job page
         
+        Results are cached by URL, so a job that turns up in several
+        categories is only downloaded once. Failed fetches are not cached.
+        
         Args:
             job_url: URL of the job posting
             
         Returns:
             Dict containing job details
         """
+        cached = self._get_cached_detail(job_url)
+        if cached is not None:
+            return cached
+            
         details = {
             "description": "",
             "requirements": "",
             "category": ""
         }
         
-        soup = self._fetch_page(job_url)
-        if not soup:
+        tree = self._fetch_tree(job_url)
+        if tree is None:
             return details
             
         try:
-            # Find job description
-            desc_elem = soup.find("div", class_="job_description")
-            if desc_elem:
-                details["description"] = desc_elem.get_text(strip=True)
+            # Find the job description, requirements and category
+            for key, field_xp in _DETAIL_FIELD_XPS.items():
+                elem = field_xp(tree)
+                if elem:
+                    details[key] = element_text(elem[0])
                 
-            # Find job requirements
-            req_elem = soup.find("div", class_="job_requirements")
-            if req_elem:
-                details["requirements"] = req_elem.get_text(strip=True)
-                
-            # Find job category
-            cat_elem = soup.find("span", class_="job_category")
-            if cat_elem:
-                details["category"] = cat_elem.get_text(strip=True)
+            self._cache_detail(job_url, details)
                 
         except Exception as e:
             self.logger.error(f"Error extracting job details from {job_url}: {str(e)}")
             
         return details
 
+    def _parse_card(self, card) -> Optional[dict]:
+        """
+        Extract the listing fields from a job card
+        
+        Args:
+            card: lxml element of a job card
+            
+        Returns:
+            Dict with title, company, url and date, or None if the card lacks
+            a title, company or link
+        """
+        title_elem = _TITLE_XP(card)
+        company_elem = _COMPANY_XP(card)
+        date_elem = _DATE_XP(card)
+        
+        if not title_elem or not company_elem:
+            return None
+            
+        # Get job URL
+        title_link = _TITLE_LINK_XP(title_elem[0])
+        if not title_link:
+            return None
+            
+        return {
+            "title": element_text(title_elem[0]),
+            "company": element_text(company_elem[0]),
+            "url": urljoin(self.base_url, title_link[0]),
+            "date": self._parse_date(element_text(date_elem[0])) if date_elem else None
+        }
+
     def _scrape_category(self, category: str) -> List[JobPosting]:
         """
         Scrape jobs from a specific category
@@ -140,65 +212,66 @@ class RemoteCoScraper(BaseScraper):
         jobs: List[JobPosting] = []
         page = 1
         
+        # Same for every page and card of the category
+        category_url = self._get_category_url(category)
+        category_label = f"Category: {self.CATEGORIES.get(category, 'Unknown')}"
+        
         while True:
             try:
-                url = self._get_category_url(category)
-                if page > 1:
-                    url = f"{url}/page-{page}"
+                url = category_url if page == 1 else f"{category_url}/page-{page}"
                     
-                soup = self._fetch_page(url)
-                if not soup:
+                html = self._fetch_html(url)
+                # Pages past the last one have no job cards; stop without parsing them
+                if not html or "job_listing" not in html:
+                    break
+                    
+                tree = self._parse_tree(html, url)
+                if tree is None:
                     break
                     
                 # Find all job listings
-                job_cards = soup.find_all("div", class_="job_listing")
+                job_cards = _CARD_XP(tree)
                 
                 if not job_cards:
                     break
                     
+                listings = []
                 for card in job_cards:
                     try:
-                        # Extract job details
-                        title_elem = card.find("h2", class_="job_title")
-                        company_elem = card.find("span", class_="company_name")
-                        date_elem = card.find("span", class_="job_date")
-                        
-                        if not all([title_elem, company_elem]):
-                            continue
-                            
-                        # Get job URL
-                        title_link = title_elem.find("a", href=True)
-                        if not title_link:
-                            continue
-                            
-                        job_url = urljoin(self.base_url, title_link["href"])
-                        
-                        # Get detailed job information
-                        details = self._extract_job_details(job_url)
+                        listing = self._parse_card(card)
+                        if listing and listing["url"] not in self.known_urls:
+                            listings.append(listing)
+                    except Exception as e:
+                        self.logger.error(f"Error parsing job card: {str(e)}")
+                        continue
                         
-                        # Combine description with requirements
-                        full_description = "\n\n".join([
-                            f"Category: {details['category'] or self.CATEGORIES.get(category, 'Unknown')}",
+                # Fetch the detail pages of all cards on this page concurrently
+                all_details = self._run_concurrently(
+                    self._extract_job_details,
+                    [listing["url"] for listing in listings]
+                )
+                
+                for listing, details in zip(listings, all_details):
+                    # Combine description with requirements, skipping empty
+                    # sections so they do not leave runs of blank lines
+                    full_description = "\n\n".join([
+                        part for part in (
+                            f"Category: {details['category']}" if details["category"] else category_label,
                             "Description:",
                             details["description"],
                             "Requirements:",
                             details["requirements"]
-                        ])
-                        
-                        job = JobPosting(
-                            title=title_elem.get_text(strip=True),
-                            company=company_elem.get_text(strip=True),
-                            location="Remote",  # All jobs are remote
-                            url=job_url,
-                            description=full_description,
-                            posted_date=self._parse_date(date_elem.get_text(strip=True)) if date_elem else None
-                        )
-                        
-                        jobs.append(job)
-                        
-                    except Exception as e:
-                        self.logger.error(f"Error parsing job card: {str(e)}")
-                        continue
+                        ) if part
+                    ])
+                    
+                    jobs.append(JobPosting(
+                        title=listing["title"],
+                        company=listing["company"],
+                        location="Remote",  # All jobs are remote
+                        url=listing["url"],
+                        description=full_description,
+                        posted_date=listing["date"]
+                    ))
                         
                 page += 1
                 
@@ -225,6 +298,7 @@ class RemoteCoScraper(BaseScraper):
         jobs: List[JobPosting] = []
         
         # Map keywords to categories
+        keyword_categories = []
         for keyword in keywords:
             keyword_lower = keyword.lower()
             
@@ -238,16 +312,36 @@ class RemoteCoScraper(BaseScraper):
             if not matching_categories:
                 matching_categories = ["software-dev"]
                 
-            # Scrape jobs from matching categories
+            keyword_categories.append((keyword_lower, matching_categories))
+            
+        # Scrape every category needed by any keyword once, several at a time
+        categories = list(dict.fromkeys(
+            category for _, matching_categories in keyword_categories
+            for category in matching_categories
+        ))
+        jobs_by_category = dict(zip(
+            categories,
+            self._run_concurrently(self._scrape_category, categories, MAX_CONCURRENT_CATEGORIES)
+        ))
+        
+        # Lowercased (job, title, description) per category, built on first use
+        # and shared by every keyword filtering that category
+        lowered_jobs: Dict[str, List[Tuple[JobPosting, str, str]]] = {}
+        
+        for keyword_lower, matching_categories in keyword_categories:
             for category in matching_categories:
-                category_jobs = self._scrape_category(category)
+                category_jobs = jobs_by_category[category]
                 
                 # Filter jobs by keyword if not in category name
                 if keyword_lower not in self.CATEGORIES[category].lower():
+                    if category not in lowered_jobs:
+                        lowered_jobs[category] = [
+                            (job, job.title.lower(), job.description.lower())
+                            for job in category_jobs
+                        ]
                     category_jobs = [
-                        job for job in category_jobs
-                        if keyword_lower in job.title.lower() or
-                        keyword_lower in job.description.lower()
+                        job for job, title_lower, description_lower in lowered_jobs[category]
+                        if keyword_lower in title_lower or keyword_lower in description_lower
                     ]
                 
                 jobs.extend(category_jobs)
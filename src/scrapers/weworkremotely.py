@@ -2,12 +2,69 @@
 WeWorkRemotely job board scraper implementation
 """
 from typing import List, Optional, Dict
-from datetime import datetime, timedelta
+from datetime import date, timedelta
+from functools import lru_cache
 import re
 from urllib.parse import urljoin
-import time
 from bs4 import BeautifulSoup
-from .base import BaseScraper, JobPosting
+from lxml.etree import XPath
+from src.utils.rate_limit import RateLimiter
+from .base import BaseScraper, JobPosting, class_strainer, element_text, has_class
+
+# Relative posting dates such as "2 days ago" or "< 1 week ago"
+_DAYS_RE = re.compile(r"(\d+)\s+days?\s+ago")
+_WEEKS_RE = re.compile(r"<?\s*(\d+)\s+weeks?\s+ago")
+
+# Requests per second sent to weworkremotely.com, which throttles scrapers
+REQUESTS_PER_SECOND = 5
+
+# Only the job sections of a category page are parsed into a tree
+_LISTING_STRAINER = class_strainer("section", "jobs")
+
+# Parts of a job's detail page, which is parsed with lxml directly. Salary and
+# requirements are looked up inside the listing container.
+_CONTENT_XP = XPath(f"(//div[{has_class('listing-container')}])[1]")
+_SALARY_XP = XPath(f"(.//div[{has_class('salary')}])[1]")
+_REQUIREMENTS_XP = XPath(f"(.//div[{has_class('requirements')}])[1]")
+_TAGS_XP = XPath(f"//span[{has_class('listing-tag')}]")
+
+@lru_cache(maxsize=512)
+def _parse_relative_date(date_str: str, today: date) -> Optional[str]:
+    """
+    Resolve a lowercased WeWorkRemotely date string against a reference date
+    
+    WeWorkRemotely only uses a handful of distinct date strings per run, so
+    results are memoized per string and reference date.
+    
+    Args:
+        date_str: Lowercased, stripped date string
+        today: Reference date for relative dates
+        
+    Returns:
+        ISO formatted date string or None if the format is not recognized
+        
+    Raises:
+        OverflowError: If the resolved date is out of range
+    """
+    if "today" in date_str or "< 24h" in date_str:
+        return today.isoformat()
+        
+    if "yesterday" in date_str:
+        return (today - timedelta(days=1)).isoformat()
+        
+    # Match patterns like "2 days ago"
+    days_match = _DAYS_RE.search(date_str)
+    if days_match:
+        days = int(days_match.group(1))
+        return (today - timedelta(days=days)).isoformat()
+        
+    # Match patterns like "< 1 week ago"
+    weeks_match = _WEEKS_RE.search(date_str)
+    if weeks_match:
+        weeks = int(weeks_match.group(1))
+        return (today - timedelta(weeks=weeks)).isoformat()
+        
+    return None
 
 class WeWorkRemotelyScraper(BaseScraper):
     """Scraper for WeWorkRemotely website"""
@@ -21,6 +78,22 @@ class WeWorkRemotelyScraper(BaseScraper):
         "all": "All Remote Jobs"
     }
     
+    # Terms that also count as a match for a keyword containing the key
+    RELATED_TERMS = {
+        "developer": ["engineer", "programmer", "dev", "coding", "software", "application"],
+        "engineer": ["developer", "programming", "technical", "software", "systems"],
+        "devops": ["sysadmin", "infrastructure", "cloud", "aws", "azure", "kubernetes", "docker"],
+        "frontend": ["react", "vue", "angular", "javascript", "typescript", "ui", "web"],
+        "backend": ["python", "java", "node", "api", "database", "server"],
+        "intern": ["internship", "student", "graduate", "junior", "entry", "trainee", "entry-level"],
+        "junior": ["entry level", "graduate", "intern", "trainee", "entry-level", "junior"],
+        "entry level": ["junior", "graduate", "intern", "trainee", "entry-level"],
+        "software engineer": ["developer", "programmer", "swe", "software developer"],
+        "qa": ["quality", "test", "testing", "qe", "quality engineer"],
+        "data": ["analytics", "scientist", "analysis", "ml", "ai"],
+        "security": ["cybersecurity", "infosec", "cyber", "security engineer"]
+    }
+    
     def __init__(self):
         super().__init__("https://weworkremotely.com")
         self.session.headers.update({
@@ -29,43 +102,25 @@ class WeWorkRemotelyScraper(BaseScraper):
             "Cache-Control": "no-cache",
             "Pragma": "no-cache"
         })
+        self.rate_limiter = RateLimiter(REQUESTS_PER_SECOND)
         
-    def _parse_date(self, date_str: str) -> Optional[str]:
+    def _parse_date(self, date_str: str, today: Optional[date] = None) -> Optional[str]:
         """
         Parse WeWorkRemotely date format to ISO format
         
         Args:
             date_str: Date string from WWR (e.g., "2 days ago", "< 1 week ago")
+            today: Reference date for relative dates, defaults to today
             
         Returns:
             ISO formatted date string or None if parsing fails
         """
+        if today is None:
+            today = date.today()
         try:
-            date_str = date_str.lower().strip()
-            today = datetime.now()
-            
-            if "today" in date_str or "< 24h" in date_str:
-                return today.strftime("%Y-%m-%d")
-                
-            if "yesterday" in date_str:
-                return (today - timedelta(days=1)).strftime("%Y-%m-%d")
-                
-            # Match patterns like "2 days ago"
-            days_match = re.search(r"(\d+)\s+days?\s+ago", date_str)
-            if days_match:
-                days = int(days_match.group(1))
-                return (today - timedelta(days=days)).strftime("%Y-%m-%d")
-                
-            # Match patterns like "< 1 week ago"
-            weeks_match = re.search(r"<?\s*(\d+)\s+weeks?\s+ago", date_str)
-            if weeks_match:
-                weeks = int(weeks_match.group(1))
-                return (today - timedelta(weeks=weeks)).strftime("%Y-%m-%d")
-                
-            return None
-            
-        except Exception as e:
-            self.logger.error(f"Error parsing date {date_str}: {str(e)}")
+            return _parse_relative_date(date_str.lower().strip(), today)
+        except OverflowError:
+            self.logger.error(f"Error parsing date {date_str}: out of range")
             return None
 
     def _get_category_url(self, category: str) -> str:
@@ -111,12 +166,20 @@ class WeWorkRemotelyScraper(BaseScraper):
         """
         Extract detailed job information from job page
         
+        Results are cached by URL for the lifetime of the scraper, so later
+        runs do not download the same posting again. Failed fetches are not
+        cached.
+        
         Args:
             job_url: URL of the job posting
             
         Returns:
             Dict containing job details
         """
+        cached = self._get_cached_detail(job_url)
+        if cached is not None:
+            return cached
+            
         details = {
             "description": "",
             "requirements": "",
@@ -125,74 +188,103 @@ class WeWorkRemotelyScraper(BaseScraper):
             "tags": []
         }
         
-        # Add delay to avoid rate limiting
-        time.sleep(1)
-        
-        soup = self._fetch_page(job_url)
-        if not soup:
+        tree = self._fetch_tree(job_url)
+        if tree is None:
             return details
             
         try:
             # Find job description
-            content_div = soup.find("div", class_="listing-container")
+            content_div = _CONTENT_XP(tree)
             if content_div:
+                content_div = content_div[0]
+                
                 # Extract salary range if available
-                salary_elem = content_div.find("div", class_="salary")
+                salary_elem = _SALARY_XP(content_div)
                 if salary_elem:
-                    details["salary_range"] = salary_elem.get_text(strip=True)
+                    details["salary_range"] = element_text(salary_elem[0])
                 
                 # Extract job requirements
-                req_section = content_div.find("div", class_="requirements")
+                req_section = _REQUIREMENTS_XP(content_div)
                 if req_section:
-                    details["requirements"] = req_section.get_text(strip=True)
+                    details["requirements"] = element_text(req_section[0])
                 
                 # Extract full description
-                details["description"] = content_div.get_text(strip=True)
+                details["description"] = element_text(content_div)
                 
             # Extract job tags
-            tags = soup.find_all("span", class_="listing-tag")
-            details["tags"] = [tag.get_text(strip=True) for tag in tags]
+            details["tags"] = [element_text(tag) for tag in _TAGS_XP(tree)]
             details["job_type"] = self._extract_job_type(details["tags"])
             
+            self._cache_detail(job_url, details)
+            
         except Exception as e:
             self.logger.error(f"Error extracting job details from {job_url}: {str(e)}")
             
         return details
 
-    def _matches_keyword(self, job_data: dict, keyword: str) -> bool:
-        """Enhanced keyword matching with more flexible criteria"""
-        keyword_lower = keyword.lower()
-        title_lower = job_data["title"].lower()
-        description_lower = job_data["description"].lower() if job_data["description"] else ""
+    def _parse_item(self, item) -> Optional[dict]:
+        """
+        Extract the listing fields from a job list item
+        
+        Args:
+            item: BeautifulSoup element of a job list item
+            
+        Returns:
+            Dict with url, company, title, location and date, or None for
+            feature/view-all items and items lacking a link, company, title
+            or region
+        """
+        # Skip feature/view-all items
+        item_classes = item.get("class", [])
+        if "feature" in item_classes or "view-all" in item_classes:
+            return None
+            
+        link = item.find("a", href=True)
+        company_elem = item.find("span", class_="company")
+        title_elem = item.find("span", class_="title")
+        region_elem = item.find("span", class_="region")
+        
+        if not link or company_elem is None or title_elem is None or region_elem is None:
+            return None
+            
+        date_elem = item.find("span", class_="date")
+        return {
+            "url": urljoin(self.base_url, link["href"]),
+            "company": company_elem.text.strip(),
+            "title": title_elem.text.strip(),
+            "location": region_elem.text.strip(),
+            "date": date_elem.text.strip() if date_elem else None
+        }
+
+    def _matches_keyword(self, title_lower: str, description_lower: str, keyword_lower: str) -> bool:
+        """
+        Enhanced keyword matching with more flexible criteria
+        
+        All arguments must already be lowercased, so a job is lowercased
+        once rather than once per keyword.
+        
+        Args:
+            title_lower: Lowercased job title
+            description_lower: Lowercased job description, may be empty
+            keyword_lower: Lowercased search keyword
+            
+        Returns:
+            bool: True if the job matches the keyword or a related term
+        """
+        keyword_words = keyword_lower.split()
         
         # Direct matches
-        if any(kw in title_lower for kw in keyword_lower.split()):
+        if any(kw in title_lower for kw in keyword_words):
             return True
         
-        if description_lower and any(kw in description_lower for kw in keyword_lower.split()):
+        if description_lower and any(kw in description_lower for kw in keyword_words):
             return True
         
-        # Related terms with broader matching
-        related_terms = {
-            "developer": ["engineer", "programmer", "dev", "coding", "software", "application"],
-            "engineer": ["developer", "programming", "technical", "software", "systems"],
-            "devops": ["sysadmin", "infrastructure", "cloud", "aws", "azure", "kubernetes", "docker"],
-            "frontend": ["react", "vue", "angular", "javascript", "typescript", "ui", "web"],
-            "backend": ["python", "java", "node", "api", "database", "server"],
-            "intern": ["internship", "student", "graduate", "junior", "entry", "trainee", "entry-level"],
-            "junior": ["entry level", "graduate", "intern", "trainee", "entry-level", "junior"],
-            "entry level": ["junior", "graduate", "intern", "trainee", "entry-level"],
-            "software engineer": ["developer", "programmer", "swe", "software developer"],
-            "qa": ["quality", "test", "testing", "qe", "quality engineer"],
-            "data": ["analytics", "scientist", "analysis", "ml", "ai"],
-            "security": ["cybersecurity", "infosec", "cyber", "security engineer"]
-        }
-        
-        # Check for related terms
-        base_keyword = next((k for k in related_terms.keys() if k in keyword_lower), None)
+        # Check for related terms with broader matching
+        base_keyword = next((k for k in self.RELATED_TERMS if k in keyword_lower), None)
         if base_keyword:
             return any(term in title_lower or term in description_lower 
-                      for term in related_terms[base_keyword])
+                      for term in self.RELATED_TERMS[base_keyword])
         
         return False
 
@@ -216,85 +308,81 @@ class WeWorkRemotelyScraper(BaseScraper):
             self.logger.info(f"Scraping all jobs from WWR category {category}")
             
             url = self._get_category_url(category)
-            soup = self._fetch_page(url)
+            soup = self._fetch_page(url, _LISTING_STRAINER)
             
             if not soup:
                 return jobs
             
             # Find all job sections
             job_sections = soup.find_all("section", class_="jobs")
+            listings = []
             
             for section in job_sections:
                 job_items = section.find_all("li")
                 
                 for item in job_items:
                     try:
-                        # Skip feature/view-all items
-                        if "feature" in item.get("class", []) or "view-all" in item.get("class", []):
-                            continue
-                        
-                        # Extract basic job details
-                        link = item.find("a", href=True)
-                        if not link:
-                            continue
-                        
-                        job_url = urljoin(self.base_url, link["href"])
-                        
-                        # Skip if already processed
-                        if job_url in processed_urls:
-                            continue
-                        
-                        processed_urls.add(job_url)
-                        
-                        # Extract job information
-                        company = item.find("span", class_="company").text.strip()
-                        title = item.find("span", class_="title").text.strip()
-                        location = item.find("span", class_="region").text.strip()
-                        date_elem = item.find("span", class_="date")
-                        
-                        # Get detailed job information
-                        details = self._extract_job_details(job_url)
-                        
-                        # Format full description
-                        full_description = "\n\n".join([
-                            f"Category: {self.CATEGORIES[category]}",
-                            f"Job Type: {details['job_type']}",
-                            f"Salary Range: {details['salary_range']}" if details['salary_range'] else "",
-                            "Description:",
-                            details["description"],
-                            "Requirements:",
-                            details["requirements"],
-                            "Tags:",
-                            ", ".join(details["tags"])
-                        ])
-                        
-                        job = JobPosting(
-                            title=title,
-                            company=company,
-                            location=location,
-                            url=job_url,
-                            description=full_description,
-                            posted_date=self._parse_date(date_elem.text.strip()) if date_elem else None
-                        )
-                        
-                        # Add all jobs first, filtering will be done later
-                        jobs.append(job)
-                        
+                        listing = self._parse_item(item)
                     except Exception as e:
                         self.logger.error(f"Error processing job item: {str(e)}")
                         continue
                         
+                    # Skip incomplete items and jobs already processed
+                    if not listing or listing["url"] in processed_urls:
+                        continue
+                        
+                    processed_urls.add(listing["url"])
+                    if listing["url"] not in self.known_urls:
+                        listings.append(listing)
+            
+            # Get detailed job information for all listings concurrently
+            all_details = self._run_concurrently(
+                self._extract_job_details,
+                [listing["url"] for listing in listings]
+            )
+            
+            for listing, details in zip(listings, all_details):
+                # Format full description, leaving out empty parts such as an
+                # unknown salary so they do not add runs of blank lines
+                full_description = "\n\n".join([
+                    part for part in (
+                        f"Category: {self.CATEGORIES[category]}",
+                        f"Job Type: {details['job_type']}",
+                        f"Salary Range: {details['salary_range']}" if details['salary_range'] else "",
+                        "Description:",
+                        details["description"],
+                        "Requirements:",
+                        details["requirements"],
+                        "Tags:",
+                        ", ".join(details["tags"])
+                    ) if part
+                ])
+                
+                job = JobPosting(
+                    title=listing["title"],
+                    company=listing["company"],
+                    location=listing["location"],
+                    url=listing["url"],
+                    description=full_description,
+                    posted_date=self._parse_date(listing["date"]) if listing["date"] else None
+                )
+                
+                # Add all jobs first, filtering will be done later
+                jobs.append(job)
+                        
         except Exception as e:
             self.logger.error(f"Error scraping WWR category {category}: {str(e)}")
         
         # Now filter jobs by keywords
         filtered_jobs = []
+        keywords_lower = [keyword.lower() for keyword in keywords]
         for job in jobs:
-            for keyword in keywords:
-                if self._matches_keyword({"title": job.title, "company": job.company, 
-                                        "description": job.description}, keyword):
-                    filtered_jobs.append(job)
-                    break  # Move to next job once we find a match
+            title_lower = job.title.lower()
+            description_lower = job.description.lower() if job.description else ""
+            # any() moves to the next job once a keyword matches
+            if any(self._matches_keyword(title_lower, description_lower, keyword_lower)
+                   for keyword_lower in keywords_lower):
+                filtered_jobs.append(job)
         
         self.logger.info(f"Found {len(jobs)} total jobs, filtered to {len(filtered_jobs)} matching jobs")
         return filtered_jobs
@@ -0,0 +1,161 @@
+"""
+Persistent Bloom filter for remembering job URLs across runs
+"""
+import logging
+import math
+import os
+import struct
+from hashlib import blake2b
+from typing import Iterator
+
+# Child of the application logger, so records go through its handlers
+logger = logging.getLogger("JobAlertNotifier.utils.bloom")
+
+class BloomFilter:
+    """
+    Space-efficient probabilistic set of strings
+
+    Membership tests never give false negatives; false positives occur at
+    roughly error_rate while the filter holds at most capacity items.
+
+    Attributes:
+        capacity: Number of items the filter is sized for
+        error_rate: Target false positive rate at capacity
+        num_bits: Size of the bit array
+        num_hashes: Number of bit positions set per item
+        count: Number of items added
+    """
+
+    # File header: capacity, error_rate, count, num_bits, num_hashes
+    _HEADER = struct.Struct("<QdQQI")
+
+    def __init__(self, capacity: int = 100_000, error_rate: float = 0.001) -> None:
+        """
+        Initialize an empty Bloom filter
+
+        Args:
+            capacity: Expected number of items
+            error_rate: Target false positive rate
+
+        Raises:
+            ValueError: If capacity or error_rate is out of range
+        """
+        if capacity <= 0:
+            raise ValueError("Capacity must be positive")
+        if not 0 < error_rate < 1:
+            raise ValueError("Error rate must be between 0 and 1")
+
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.num_bits + 7) // 8)
+
+    def _positions(self, item: str) -> Iterator[int]:
+        """Yield the bit positions for an item using double hashing"""
+        digest = blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, item: str) -> None:
+        """
+        Add an item to the filter
+
+        Args:
+            item: String to add
+        """
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        """Check whether an item was (probably) added"""
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(item)
+        )
+
+    def __len__(self) -> int:
+        """Number of items added"""
+        return self.count
+
+    def save(self, path: str) -> None:
+        """
+        Write the filter to disk
+
+        Args:
+            path: Destination file path
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # Write to a temporary file first so a crash never leaves a truncated filter
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(self._HEADER.pack(
+                self.capacity, self.error_rate, self.count, self.num_bits, self.num_hashes
+            ))
+            f.write(self._bits)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "BloomFilter":
+        """
+        Read a filter previously written with save()
+
+        Args:
+            path: Source file path
+
+        Returns:
+            BloomFilter: Loaded filter
+
+        Raises:
+            ValueError: If the file is not a valid Bloom filter
+        """
+        with open(path, "rb") as f:
+            data = f.read()
+
+        if len(data) < cls._HEADER.size:
+            raise ValueError(f"Invalid Bloom filter file: {path}")
+
+        capacity, error_rate, count, num_bits, num_hashes = cls._HEADER.unpack_from(data)
+        bits = data[cls._HEADER.size:]
+        if num_bits == 0 or num_hashes == 0 or len(bits) != (num_bits + 7) // 8:
+            raise ValueError(f"Invalid Bloom filter file: {path}")
+
+        bloom = cls.__new__(cls)
+        bloom.capacity = capacity
+        bloom.error_rate = error_rate
+        bloom.count = count
+        bloom.num_bits = num_bits
+        bloom.num_hashes = num_hashes
+        bloom._bits = bytearray(bits)
+        return bloom
+
+    @classmethod
+    def load_or_create(cls, path: str, capacity: int = 100_000,
+                       error_rate: float = 0.001) -> "BloomFilter":
+        """
+        Load a filter from disk, or create an empty one if none exists
+
+        A file that cannot be read or is damaged is logged and replaced by an
+        empty filter, so it does not make every later run fail.
+
+        Args:
+            path: File path of the persisted filter
+            capacity: Capacity for a newly created filter
+            error_rate: Error rate for a newly created filter
+
+        Returns:
+            BloomFilter: Loaded or newly created filter
+        """
+        if os.path.exists(path):
+            try:
+                return cls.load(path)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Discarding unreadable Bloom filter file: {str(e)}")
+        return cls(capacity, error_rate)
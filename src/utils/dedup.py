@@ -0,0 +1,64 @@
+"""
+Duplicate detection for job postings reposted across sites
+"""
+from typing import List, Set, Tuple
+from src.scrapers.base import JobPosting
+from src.utils.filters import normalize_text
+
+def job_key(job: JobPosting) -> Tuple[str, str, str]:
+    """
+    Build the key identifying a job regardless of where it was posted
+
+    Only exact matches after normalization count as the same job, so
+    postings that differ in seniority or level ("Senior" vs "Junior",
+    "II" vs "III") are kept apart.
+
+    Args:
+        job: JobPosting to identify
+
+    Returns:
+        Tuple of normalized title, company and location
+    """
+    return (
+        normalize_text(job.title),
+        normalize_text(job.company),
+        normalize_text(job.location)
+    )
+
+class RepostFilter:
+    """
+    Incremental detector for the same job posted under different URLs
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty filter"""
+        self._keys: Set[Tuple[str, str, str]] = set()
+
+    def add(self, job: JobPosting) -> bool:
+        """
+        Record a job unless the same job was already recorded
+
+        Args:
+            job: JobPosting to check
+
+        Returns:
+            bool: True if the job was new, False if it is a repost
+        """
+        key = job_key(job)
+        if key in self._keys:
+            return False
+        self._keys.add(key)
+        return True
+
+def remove_reposts(jobs: List[JobPosting]) -> List[JobPosting]:
+    """
+    Drop jobs with the same normalized title, company and location as an earlier job
+
+    Args:
+        jobs: List of job postings
+
+    Returns:
+        List of job postings with reposts removed, in original order
+    """
+    reposts = RepostFilter()
+    return [job for job in jobs if reposts.add(job)]
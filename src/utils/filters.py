@@ -2,12 +2,11 @@
 Job filtering utilities with enhanced text normalization and logging
 """
 from dataclasses import dataclass, field
-from typing import List, Optional, Set
+from typing import Iterable, List, Optional, Pattern, Set
 import re
 import logging
 from datetime import datetime, timedelta
 from src.scrapers.base import JobPosting
-from src.utils.logger import setup_logger
 
 @dataclass
 class FilterCriteria:
@@ -73,6 +72,41 @@ def normalize_text(text: Optional[str]) -> str:
     
     return normalized
 
+def compile_terms(terms: Iterable[str]) -> Optional[Pattern]:
+    """
+    Compile terms into a single case-insensitive substring-matching regex
+    
+    Args:
+        terms: Literal terms to match
+        
+    Returns:
+        Compiled pattern, or None if there are no terms
+        
+    Note:
+        Terms are arranged in a prefix trie so the regex engine checks each
+        text position against shared prefixes once, instead of trying every
+        term in a flat alternation. Only whether a match exists is preserved,
+        so terms extending a shorter term are dropped.
+    """
+    trie: dict = {}
+    for term in {t.lower() for t in terms if t}:
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[""] = {}
+        
+    if not trie:
+        return None
+        
+    def build(node: dict) -> str:
+        # A complete term already matches, so longer continuations are irrelevant
+        if "" in node:
+            return ""
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items())]
+        return branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        
+    return re.compile(build(trie), re.IGNORECASE)
+
 class JobFilter:
     """
     Job filtering implementation with enhanced matching and logging
@@ -92,7 +126,8 @@ class JobFilter:
             criteria: FilterCriteria instance defining filter rules
         """
         self.criteria = criteria
-        self.logger = setup_logger("logs/job_filter.log")
+        # Child of the application logger, so records go through its handlers
+        self.logger = logging.getLogger("JobAlertNotifier.filters")
         
         # Normalize and store keywords
         self.keywords: Set[str] = {
@@ -115,6 +150,16 @@ class JobFilter:
                 self.logger.error(f"Invalid regex pattern: {str(e)}")
                 raise ValueError(f"Invalid regex pattern: {str(e)}")
                 
+        # Precompile the matchers used by filter_jobs so each job is scanned
+        # once per matcher instead of once per term
+        self._excluded_pattern = compile_terms(criteria.excluded_titles)
+        self._category_pattern = compile_terms(criteria.categories)
+        self._keyword_pattern = compile_terms(
+            term
+            for keyword in criteria.keywords
+            for term in [keyword, *self._get_related_terms(keyword)]
+        )
+                
         self.logger.info(
             f"Initialized filter with {len(self.keywords)} keywords "
             f"and {len(self.locations)} locations"
@@ -224,73 +269,79 @@ class JobFilter:
             
         return True
 
+    def matches(self, job: JobPosting) -> bool:
+        """
+        Check if a single job passes the filter
+        
+        Args:
+            job: JobPosting to check
+            
+        Returns:
+            bool: True if the job matches the filter criteria
+        """
+        try:
+            # Log the job being processed
+            self.logger.debug(f"Processing job: {job.title}")
+            
+            title = job.title
+            description = job.description or ""
+            
+            # Check excluded titles first
+            if self._excluded_pattern and self._excluded_pattern.search(title):
+                self.logger.debug(f"Job {job.title} excluded by title")
+                return False
+            
+            # More lenient category matching
+            category_match = self._category_pattern is not None and bool(
+                self._category_pattern.search(title) or
+                self._category_pattern.search(description)
+            )
+            
+            if not category_match:
+                self.logger.debug(f"Job {job.title} failed category match")
+                return False
+            
+            # More lenient keyword matching, including related terms
+            keyword_match = self._keyword_pattern is not None and bool(
+                self._keyword_pattern.search(title) or
+                self._keyword_pattern.search(description)
+            )
+            
+            if keyword_match:
+                self.logger.debug(f"Job {job.title} matched filters")
+            else:
+                self.logger.debug(f"Job {job.title} failed keyword match")
+            return keyword_match
+                
+        except Exception as e:
+            self.logger.error(f"Error filtering job {job.title}: {str(e)}")
+            return False
+
     def filter_jobs(self, jobs: List[JobPosting]) -> List[JobPosting]:
         """Filter jobs based on criteria"""
         self.logger.info(f"Filtering {len(jobs)} jobs")
-        filtered_jobs = []
-        
-        for job in jobs:
-            try:
-                # Log the job being processed
-                self.logger.debug(f"Processing job: {job.title}")
-                
-                # Check excluded titles first
-                if any(excluded.lower() in job.title.lower() 
-                      for excluded in self.criteria.excluded_titles):
-                    self.logger.debug(f"Job {job.title} excluded by title")
-                    continue
-                
-                # More lenient category matching
-                category_match = any(
-                    category.lower() in job.title.lower() or 
-                    (job.description and category.lower() in job.description.lower())
-                    for category in self.criteria.categories
-                )
-                
-                if not category_match:
-                    self.logger.debug(f"Job {job.title} failed category match")
-                    continue
-                
-                # More lenient keyword matching
-                keyword_match = any(
-                    keyword.lower() in job.title.lower() or 
-                    (job.description and keyword.lower() in job.description.lower()) or
-                    any(related.lower() in job.title.lower() or 
-                        (job.description and related.lower() in job.description.lower())
-                        for related in self._get_related_terms(keyword))
-                    for keyword in self.criteria.keywords
-                )
-                
-                if keyword_match:
-                    filtered_jobs.append(job)
-                    self.logger.debug(f"Job {job.title} matched filters")
-                else:
-                    self.logger.debug(f"Job {job.title} failed keyword match")
-                    
-            except Exception as e:
-                self.logger.error(f"Error filtering job {job.title}: {str(e)}")
-                continue
-        
+        filtered_jobs = [job for job in jobs if self.matches(job)]
         self.logger.info(f"Filtered {len(jobs)} jobs down to {len(filtered_jobs)} matches")
         return filtered_jobs
 
+    # Related terms used to broaden keyword matches
+    RELATED_TERMS = {
+        "developer": ["engineer", "programmer", "dev", "coding", "software"],
+        "engineer": ["developer", "programming", "technical", "software"],
+        "devops": ["sysadmin", "infrastructure", "cloud", "aws", "azure"],
+        "frontend": ["react", "vue", "angular", "javascript", "typescript"],
+        "backend": ["python", "java", "node", "api", "database"],
+        "intern": ["internship", "student", "graduate", "junior", "entry"],
+        "junior": ["entry level", "graduate", "intern", "trainee"],
+        "software": ["developer", "engineer", "programming", "coder"],
+        "data": ["analytics", "scientist", "analysis", "ml", "ai"],
+        "security": ["cybersecurity", "infosec", "cyber"]
+    }
+
     def _get_related_terms(self, keyword: str) -> List[str]:
         """Get related terms for a keyword"""
-        related_terms = {
-            "developer": ["engineer", "programmer", "dev", "coding", "software"],
-            "engineer": ["developer", "programming", "technical", "software"],
-            "devops": ["sysadmin", "infrastructure", "cloud", "aws", "azure"],
-            "frontend": ["react", "vue", "angular", "javascript", "typescript"],
-            "backend": ["python", "java", "node", "api", "database"],
-            "intern": ["internship", "student", "graduate", "junior", "entry"],
-            "junior": ["entry level", "graduate", "intern", "trainee"],
-            "software": ["developer", "engineer", "programming", "coder"],
-            "data": ["analytics", "scientist", "analysis", "ml", "ai"],
-            "security": ["cybersecurity", "infosec", "cyber"]
-        }
-        
         keyword_lower = keyword.lower()
-        for base_term, related in related_terms.items():
+        for base_term, related in self.RELATED_TERMS.items():
             if base_term in keyword_lower:
                 return related
         return []
@@ -2,10 +2,12 @@
 Enhanced logging configuration for the Job Alert Notifier with rotating logs,
 customizable log levels, and improved formatting.
 """
+import atexit
 import logging
 import os
+import queue
 from datetime import datetime
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from typing import Optional, Union, Literal
 import sys
 
@@ -49,29 +51,52 @@ def get_log_level(level: LogLevel) -> int:
         return level_map[level.upper()]
     return level
 
+# Background listener writing queued records to the log handlers
+_listener: Optional[QueueListener] = None
+
 def setup_logger(log_file: str) -> logging.Logger:
     """Set up and configure the application logger.
     
+    Records are put on an in-memory queue and written to the file and console
+    by a background listener thread, so logging calls never block on disk I/O.
+    The logger is configured once; while the listener is running, later calls
+    return it unchanged, so no records are lost to a handler swap. Call
+    shutdown_logger() first to reconfigure it.
+    
     Args:
         log_file (str): Path to the log file
         
     Returns:
         logging.Logger: Configured logger instance
     """
+    global _listener
+    
     # Create logger
     logger = logging.getLogger("JobAlertNotifier")
     
-    # Prevent adding handlers if they already exist
+    # Already configured, keep the running listener and its handlers
+    if _listener is not None:
+        return logger
+        
+    # Drop handlers left over from a configuration that was shut down
     if logger.hasHandlers():
         logger.handlers.clear()
     
     logger.setLevel(logging.INFO)
     
     # Create formatters
-    formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - [%(module)s:%(lineno)d] - %(message)s")
+    formatter = logging.Formatter(LogConfig.LOG_FORMAT)
     
-    # File handler for main log file
-    file_handler = logging.FileHandler(log_file, encoding="utf-8")
+    # Rotating file handler for main log file
+    log_dir = os.path.dirname(log_file)
+    if log_dir:
+        os.makedirs(log_dir, exist_ok=True)
+    file_handler = RotatingFileHandler(
+        log_file,
+        maxBytes=LogConfig.MAX_BYTES,
+        backupCount=LogConfig.BACKUP_COUNT,
+        encoding="utf-8"
+    )
     file_handler.setLevel(logging.INFO)
     file_handler.setFormatter(formatter)
     
@@ -80,15 +105,32 @@ def setup_logger(log_file: str) -> logging.Logger:
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(formatter)
     
-    # Add handlers to logger
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    # Hand records to a background listener instead of writing inline
+    log_queue = queue.SimpleQueue()
+    _listener = QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    _listener.start()
+    logger.addHandler(QueueHandler(log_queue))
     
     # Prevent propagation to prevent duplicate logs
     logger.propagate = False
     
     return logger
 
+def shutdown_logger() -> None:
+    """Flush queued log records and stop the background listener"""
+    global _listener
+    
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+# Make sure queued records are written before the interpreter exits
+atexit.register(shutdown_logger)
+
 def get_logger() -> logging.Logger:
     """
     Get existing logger instance or create new one with default settings
@@ -0,0 +1,122 @@
+"""
+Token-bucket rate limiting for asyncio and threaded code
+"""
+import asyncio
+import threading
+import time
+
+class AsyncRateLimiter:
+    """
+    Async context manager allowing at most max_rate entries per time_period
+
+    Up to max_rate entries may pass in a burst; after that, entries are
+    spaced evenly. Waiting callers are served in arrival order.
+
+    Attributes:
+        max_rate: Number of entries allowed per time period
+        time_period: Length of the time period in seconds
+    """
+
+    def __init__(self, max_rate: float, time_period: float = 1.0) -> None:
+        """
+        Initialize a limiter with a full bucket
+
+        Args:
+            max_rate: Number of entries allowed per time period
+            time_period: Length of the time period in seconds
+
+        Raises:
+            ValueError: If max_rate or time_period is not positive
+        """
+        if max_rate <= 0 or time_period <= 0:
+            raise ValueError("Rate and time period must be positive")
+
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self._tokens = float(max_rate)
+        self._last_refill = time.monotonic()
+
+    async def acquire(self) -> None:
+        """Wait until an entry is allowed"""
+        now = time.monotonic()
+        refill = (now - self._last_refill) * self.max_rate / self.time_period
+        self._tokens = min(self.max_rate, self._tokens + refill)
+        self._last_refill = now
+
+        # Take a token even if the bucket is empty; a negative balance
+        # reserves a future slot, so later callers queue up behind this one
+        self._tokens -= 1
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens * self.time_period / self.max_rate)
+
+    async def __aenter__(self) -> "AsyncRateLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        return None
+
+class RateLimiter:
+    """
+    Thread-safe blocking limiter allowing at most max_rate calls per time_period
+
+    Counterpart of AsyncRateLimiter for code running in worker threads. Up
+    to max_rate calls may pass in a burst; after that, calls are spaced
+    evenly. pause() holds back all later calls, e.g. to honor a server's
+    Retry-After header.
+
+    Attributes:
+        max_rate: Number of calls allowed per time period
+        time_period: Length of the time period in seconds
+    """
+
+    def __init__(self, max_rate: float, time_period: float = 1.0) -> None:
+        """
+        Initialize a limiter with a full bucket
+
+        Args:
+            max_rate: Number of calls allowed per time period
+            time_period: Length of the time period in seconds
+
+        Raises:
+            ValueError: If max_rate or time_period is not positive
+        """
+        if max_rate <= 0 or time_period <= 0:
+            raise ValueError("Rate and time period must be positive")
+
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self._tokens = float(max_rate)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a call is allowed"""
+        with self._lock:
+            now = time.monotonic()
+            # After pause() the refill clock is in the future; nothing accrues until then
+            if now > self._last_refill:
+                refill = (now - self._last_refill) * self.max_rate / self.time_period
+                self._tokens = min(self.max_rate, self._tokens + refill)
+                self._last_refill = now
+
+            # As in AsyncRateLimiter, a negative balance reserves a future slot
+            self._tokens -= 1
+            delay = self._last_refill - now
+            if self._tokens < 0:
+                delay += -self._tokens * self.time_period / self.max_rate
+
+        # Sleep outside the lock so other threads can reserve their slots
+        if delay > 0:
+            time.sleep(delay)
+
+    def pause(self, seconds: float) -> None:
+        """
+        Hold back calls for the given time, then resume with an empty bucket
+
+        Args:
+            seconds: Time to wait before the next call is allowed
+        """
+        with self._lock:
+            self._last_refill = max(self._last_refill, time.monotonic() + seconds)
+            self._tokens = min(self._tokens, 0.0)
@@ -0,0 +1,39 @@
+"""
+Tests for the shared scraper page parsing
+"""
+import logging
+import unittest
+from typing import List
+from src.scrapers.base import BaseScraper, JobPosting, element_text
+
+class StubScraper(BaseScraper):
+    """Scraper with no site of its own, for exercising BaseScraper helpers"""
+
+    def __init__(self) -> None:
+        super().__init__("https://example.com", logger=logging.getLogger(__name__))
+
+    def scrape_jobs(self, keywords: List[str]) -> List[JobPosting]:
+        return []
+
+class ParseTreeTest(unittest.TestCase):
+    """Tests for BaseScraper._parse_tree"""
+
+    def setUp(self) -> None:
+        self.scraper = StubScraper()
+
+    def test_page_with_xml_encoding_prolog_is_parsed(self) -> None:
+        html = (
+            '<?xml version="1.0" encoding="iso-8859-2"?>\n'
+            '<html><body><div class="location">București</div></body></html>'
+        )
+
+        tree = self.scraper._parse_tree(html, "https://example.com/job")
+
+        self.assertIsNotNone(tree)
+        self.assertEqual(element_text(tree.xpath("//div")[0]), "București")
+
+    def test_empty_page_returns_none(self) -> None:
+        self.assertIsNone(self.scraper._parse_tree("", "https://example.com/job"))
+
+if __name__ == "__main__":
+    unittest.main()
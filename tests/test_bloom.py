@@ -0,0 +1,52 @@
+"""
+Tests for the persistent Bloom filter
+"""
+import os
+import tempfile
+import unittest
+from src.utils.bloom import BloomFilter
+
+class LoadOrCreateTest(unittest.TestCase):
+    """Tests for BloomFilter.load_or_create"""
+
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, "seen_jobs.bloom")
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+
+    def test_saved_filter_is_loaded(self) -> None:
+        bloom = BloomFilter(capacity=100)
+        bloom.add("https://example.com/job")
+        bloom.save(self.path)
+
+        loaded = BloomFilter.load_or_create(self.path)
+
+        self.assertIn("https://example.com/job", loaded)
+        self.assertEqual(len(loaded), 1)
+
+    def test_truncated_file_is_replaced_by_empty_filter(self) -> None:
+        bloom = BloomFilter(capacity=100)
+        bloom.add("https://example.com/job")
+        bloom.save(self.path)
+        with open(self.path, "r+b") as f:
+            f.truncate(os.path.getsize(self.path) - 1)
+
+        with self.assertLogs("JobAlertNotifier.utils.bloom", level="WARNING"):
+            loaded = BloomFilter.load_or_create(self.path, capacity=100)
+
+        self.assertEqual(len(loaded), 0)
+        self.assertNotIn("https://example.com/job", loaded)
+
+    def test_garbage_file_is_replaced_by_empty_filter(self) -> None:
+        with open(self.path, "wb") as f:
+            f.write(b"\0" * 64)
+
+        with self.assertLogs("JobAlertNotifier.utils.bloom", level="WARNING"):
+            loaded = BloomFilter.load_or_create(self.path)
+
+        self.assertEqual(len(loaded), 0)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+"""
+Tests for repost detection
+"""
+import unittest
+from src.scrapers.base import JobPosting
+from src.utils.dedup import RepostFilter, remove_reposts
+
+def make_job(title: str, company: str = "Acme", location: str = "Remote",
+             url: str = "https://example.com/job") -> JobPosting:
+    """Build a job posting with only the fields used for deduplication set"""
+    return JobPosting(title=title, company=company, location=location, url=url, description="")
+
+class RepostFilterTest(unittest.TestCase):
+    """Tests for RepostFilter and remove_reposts"""
+
+    def test_seniority_variants_are_kept(self) -> None:
+        jobs = [
+            make_job("Senior Python Developer", url="https://example.com/1"),
+            make_job("Junior Python Developer", url="https://example.com/2")
+        ]
+        self.assertEqual(remove_reposts(jobs), jobs)
+
+    def test_level_variants_are_kept(self) -> None:
+        jobs = [
+            make_job("Software Engineer II", url="https://example.com/1"),
+            make_job("Software Engineer III", url="https://example.com/2")
+        ]
+        self.assertEqual(remove_reposts(jobs), jobs)
+
+    def test_same_job_at_other_company_or_location_is_kept(self) -> None:
+        reposts = RepostFilter()
+        self.assertTrue(reposts.add(make_job("Python Developer")))
+        self.assertTrue(reposts.add(make_job("Python Developer", company="Globex")))
+        self.assertTrue(reposts.add(make_job("Python Developer", location="Bucharest")))
+
+    def test_repost_under_another_url_is_dropped(self) -> None:
+        original = make_job("Python Developer", url="https://example.com/1")
+        repost = make_job("  python developer!", company="ACME", url="https://other.example/2")
+        self.assertEqual(remove_reposts([original, repost]), [original])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+"""
+Tests for email message encoding
+"""
+import email.policy
+import unittest
+from email.message import EmailMessage
+from src.config.config import EmailConfig
+from src.notifications.email_notifier import EmailNotifier, _downgrade_to_7bit
+from src.scrapers.base import JobPosting
+
+class DowngradeTo7bitTest(unittest.TestCase):
+    """Tests for the fallback used with servers lacking 8BITMIME"""
+
+    def assert_7bit(self, msg: EmailMessage) -> None:
+        for part in msg.iter_parts():
+            self.assertNotIn(part["Content-Transfer-Encoding"], ("8bit", "binary"))
+        self.assertTrue(msg.as_bytes().isascii())
+
+    def test_short_non_ascii_parts_are_7bit(self) -> None:
+        msg = EmailMessage(policy=email.policy.SMTP)
+        msg.set_content("ăîș €", subtype="plain", charset="utf-8", cte="8bit")
+        msg.add_alternative("<p>ăîș €</p>", subtype="html", charset="utf-8", cte="8bit")
+
+        self.assert_7bit(_downgrade_to_7bit(msg))
+
+    def test_built_notification_is_7bit_and_keeps_content(self) -> None:
+        notifier = EmailNotifier(config=EmailConfig(
+            smtp_server="smtp.example.com",
+            smtp_port=587,
+            sender_email="sender@example.com",
+            sender_password="secret",
+            recipient_email="recipient@example.com"
+        ))
+        job = JobPosting(
+            title="Dezvoltator Python",
+            company="Firmă ăîș",
+            location="București",
+            url="https://example.com/job",
+            description="Salariu 5000 €"
+        )
+
+        msg = _downgrade_to_7bit(notifier._build_message([job]))
+
+        self.assert_7bit(msg)
+        plain, html = (part.get_content() for part in msg.iter_parts())
+        self.assertIn("Firmă ăîș", plain)
+        self.assertIn("Salariu 5000 €", html)
+
+class BuildMessageTest(unittest.TestCase):
+    """Tests for EmailNotifier._build_message"""
+
+    def test_job_without_location_or_url_is_rendered(self) -> None:
+        notifier = EmailNotifier(config=EmailConfig(
+            smtp_server="smtp.example.com",
+            smtp_port=587,
+            sender_email="sender@example.com",
+            sender_password="secret",
+            recipient_email="recipient@example.com"
+        ))
+        job = JobPosting(
+            title="Python Developer",
+            company="Acme",
+            location=None,
+            url=None,
+            description="Build things"
+        )
+
+        msg = notifier._build_message([job])
+
+        plain, html = (part.get_content() for part in msg.iter_parts())
+        self.assertIn("Location: Not specified", plain)
+        self.assertIn("Python Developer", html)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+"""
+Tests for Telegram delivery reporting
+"""
+import unittest
+from unittest import mock
+from src.notifications.telegram_notifier import TelegramNotifier
+from src.scrapers.base import JobPosting
+
+def make_job(index: int) -> JobPosting:
+    """Build a job whose formatted text takes a sizable part of a message"""
+    return JobPosting(
+        title=f"Python Developer {index} " + "x" * 250,
+        company="Acme",
+        location="Remote",
+        url=f"https://example.com/job-{index}",
+        description=""
+    )
+
+class SendNotificationTest(unittest.IsolatedAsyncioTestCase):
+    """Tests for TelegramNotifier.send_notification"""
+
+    def setUp(self) -> None:
+        self.notifier = TelegramNotifier("123:token", "42")
+        self.jobs = [make_job(index) for index in range(40)]
+
+    async def test_returns_true_when_all_messages_are_sent(self) -> None:
+        with mock.patch.object(self.notifier, "_send_with_limits", mock.AsyncMock()):
+            self.assertTrue(await self.notifier.send_notification(self.jobs))
+
+    async def test_returns_false_and_logs_undelivered_jobs_on_partial_failure(self) -> None:
+        messages = self.notifier._pack_messages(self.jobs)
+        self.assertGreater(len(messages), 1)
+        failed_message, failed_count = messages[-1]
+
+        async def send(message: str, parse_mode: str) -> None:
+            if message == failed_message:
+                raise RuntimeError("send failed")
+
+        with mock.patch.object(self.notifier, "_send_with_limits", side_effect=send), \
+                self.assertLogs(self.notifier.logger, level="ERROR") as logs:
+            self.assertFalse(await self.notifier.send_notification(self.jobs))
+
+        self.assertIn(f"{failed_count} of {len(self.jobs)} jobs were not delivered", logs.output[-1])
+
+    async def test_returns_false_without_jobs(self) -> None:
+        self.assertFalse(await self.notifier.send_notification([]))
+
+class PackMessagesTest(unittest.TestCase):
+    """Tests for TelegramNotifier._pack_messages"""
+
+    def setUp(self) -> None:
+        self.notifier = TelegramNotifier("123:token", "42")
+
+    def test_job_without_location_is_formatted(self) -> None:
+        job = JobPosting(title="Python Developer", company="Acme", location=None,
+                         url="https://example.com/job", description="")
+
+        (message, job_count), = self.notifier._pack_messages([job])
+
+        self.assertEqual(job_count, 1)
+        self.assertIn("Location: Not specified", message)
+
+    def test_oversized_job_is_shortened_to_fit_one_message(self) -> None:
+        job = JobPosting(title="&" * 5000, company="Acme <" * 1000, location="Remote",
+                         url="https://example.com/job", description="")
+
+        (message, job_count), = self.notifier._pack_messages([job])
+
+        self.assertEqual(job_count, 1)
+        self.assertLessEqual(len(message), TelegramNotifier.MAX_MESSAGE_LENGTH)
+        self.assertIn("https://example.com/job", message)
+
+if __name__ == "__main__":
+    unittest.main()